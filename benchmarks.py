@@ -0,0 +1,410 @@
+"""
+Micro-benchmarks for the DynamicArray and MinHeap hot paths.
+
+Each case builds its input once per size, times only the operation under test
+and reports the best of several runs as nanoseconds per element. Inputs are
+seeded, so two runs on the same machine time the same work.
+
+--json writes the results to a file; --compare reads such a file back as the
+baseline and flags every case that got slower by more than --threshold (the
+exit status is 1 if any did). --profile runs each case once under cProfile
+instead of timing it.
+
+Usage:
+    python benchmarks.py [--suite array_ops heap_ops streaming arity block_copy comparisons contention heapify parallel]
+                         [--sizes 1000 100000] [--repeat 3] [--seed 0]
+                         [--json results.json] [--compare baseline.json] [--threshold 0.1] [--profile]
+"""
+import argparse
+import cProfile
+import heapq
+import json
+import platform
+import pstats
+import random
+import sys
+import threading
+import time
+
+import numpy_backend
+from dynamic_array import CircularDynamicArray, DynamicArray, find_mode
+from min_heap import MinHeap, RunningMedian, TopK, heapsort
+from parallel import parallel_map, parallel_reduce
+from priority_queue import ConcurrentPriorityQueue
+
+
+def _best_time(setup, run, repeat: int) -> tuple:
+    """Return the fastest of repeat timed calls of run(setup()) and what the last call returned"""
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        state = setup()
+        start = time.perf_counter()
+        result = run(state)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def _filled(n: int) -> DynamicArray:
+    da = DynamicArray()
+    da.merge(DynamicArray(range(min(n, 1024))))
+    while da.length() < n:
+        da.merge(da.slice(0, min(da.length(), n - da.length())))
+    return da
+
+
+# set from --seed by main(); every suite draws from its own generator derived from it
+_seed = 0
+
+
+def _rng(suite: str, n: int) -> random.Random:
+    """Return a generator for one suite and size, so inputs do not depend on which suites ran before"""
+    return random.Random(f'{suite}:{n}:{_seed}')
+
+
+def _inputs(n: int) -> dict:
+    """Input orders every order-sensitive case is run on, seeded by n so they do not depend on the suite list"""
+    rng = _rng('inputs', n)
+    values = [rng.random() for _ in range(n)]
+    return {
+        'random': values,
+        'sorted': sorted(values),
+        'reverse': sorted(values, reverse=True),
+        'duplicates': [float(rng.randrange(16)) for _ in range(n)],
+    }
+
+
+def _insert_all(da: DynamicArray, values: list, where) -> None:
+    for value in values:
+        da.insert_at_index(where(da.length()), value)
+
+
+def _remove_n(da: DynamicArray, count: int, where) -> None:
+    for _ in range(count):
+        da.remove_at_index(where(da.length()))
+
+
+# position of an insert / remove given the current length
+_POSITIONS = {
+    'front': lambda length: 0,
+    'middle': lambda length: length // 2,
+    'back': lambda length: length,
+}
+
+
+def array_ops_cases(n: int):
+    """append / insert / remove at the front, middle and back (also circular), the bulk operations and find_mode"""
+    inputs = _inputs(n)
+    values = inputs['random']
+    base = DynamicArray(values)
+    cases = [('append', lambda: DynamicArray(), lambda da: [da.append(value) for value in values])]
+    for name, where in _POSITIONS.items():
+        cases.append((f'insert_at_index {name}', lambda: DynamicArray(),
+                      lambda da, w=where: _insert_all(da, values, w)))
+        # removing at index length is out of range, so "back" removes the last element
+        last = (lambda length: length - 1) if name == 'back' else where
+        cases.append((f'remove_at_index {name}', lambda: DynamicArray(values),
+                      lambda da, w=last: _remove_n(da, n, w)))
+    for name in ('front', 'middle'):
+        cases.append((f'circular insert {name}', lambda: CircularDynamicArray(),
+                      lambda da, w=_POSITIONS[name]: _insert_all(da, values, w)))
+        cases.append((f'circular remove {name}', lambda: CircularDynamicArray(values),
+                      lambda da, w=_POSITIONS[name]: _remove_n(da, n, w)))
+    cases += [
+        ('slice', lambda: base, lambda da: da.slice(0, n)),
+        ('merge', lambda: DynamicArray(), lambda da: da.merge(base)),
+        ('map', lambda: base, lambda da: da.map(lambda value: value * 2)),
+        ('filter', lambda: base, lambda da: da.filter(lambda value: value < 0.5)),
+        ('reduce', lambda: base, lambda da: da.reduce(lambda a, b: a + b)),
+    ]
+    for kind, keys in inputs.items():
+        cases.append((f'find_mode {kind}', lambda k=keys: DynamicArray(k), find_mode))
+    return cases
+
+
+def heap_ops_cases(n: int):
+    """MinHeap add / remove_min / build_heap and heapsort on every input order"""
+    cases = []
+    for kind, keys in _inputs(n).items():
+        # 1-tuples keep the NumPy fast path out of heapsort so the heap code is measured
+        boxed = [(key,) for key in keys]
+        cases += [
+            (f'add {kind}', lambda: MinHeap(), lambda heap, k=keys: _add_all(heap, k)),
+            (f'remove_min {kind}', lambda k=keys: MinHeap(k), _remove_all),
+            (f'build_heap {kind}', lambda k=keys: DynamicArray(k), lambda da: MinHeap().build_heap(da)),
+            (f'heapsort {kind}', lambda b=boxed: DynamicArray(b), heapsort),
+        ]
+    return cases
+
+
+def streaming_cases(n: int):
+    """TopK against heapq.nlargest, and RunningMedian, on every input order"""
+    cases = []
+    for kind, keys in _inputs(n).items():
+        cases += [
+            (f'TopK(100) {kind}', lambda: TopK(100), lambda top, k=keys: top.push_many(k)),
+            (f'heapq.nlargest(100) {kind}', lambda k=keys: k, lambda items: heapq.nlargest(100, items)),
+            (f'RunningMedian {kind}', lambda: RunningMedian(), lambda median, k=keys: median.add_many(k)),
+        ]
+    return cases
+
+
+def block_copy_cases(n: int):
+    """Operations that move the whole array through DynamicArray's copy_block()"""
+    base = _filled(n)
+    return [
+        ('resize', lambda: base.slice(0, n), lambda da: da.resize(2 * da.get_capacity())),
+        ('insert_at_index(0)', lambda: base.slice(0, n), lambda da: da.insert_at_index(0, -1)),
+        ('remove_at_index(0)', lambda: base.slice(0, n), lambda da: da.remove_at_index(0)),
+        ('slice', lambda: base, lambda da: da.slice(0, n)),
+        ('merge', lambda: DynamicArray(), lambda da: da.merge(base)),
+    ]
+
+
+def _cpu_heavy(value: int) -> int:
+    """Deliberately slow pure-Python callback (module level so process pools can pickle it)"""
+    total = value
+    for step in range(200):
+        total = (total * 31 + step) % 1000003
+    return total
+
+
+def _heavy_max(a: int, b: int) -> int:
+    """Associative but slow reduce callback"""
+    _cpu_heavy(b)
+    return a if a >= b else b
+
+
+def parallel_cases(n: int):
+    """parallel_map / parallel_reduce on a process pool with 1, 2, 4 and 8 workers"""
+    base = _filled(n)
+    cases = [('serial map', lambda: base, lambda da: da.map(_cpu_heavy))]
+    for workers in (1, 2, 4, 8):
+        cases.append((f'parallel_map w={workers}', lambda: base,
+                      lambda da, w=workers: parallel_map(da, _cpu_heavy, workers=w, executor='process')))
+    for workers in (1, 2, 4, 8):
+        cases.append((f'parallel_reduce w={workers}', lambda: base,
+                      lambda da, w=workers: parallel_reduce(da, _heavy_max, workers=w, executor='process')))
+    return cases
+
+
+def _heapsort_heapq(items: list) -> list:
+    heapq.heapify(items)
+    return [heapq.heappop(items) for _ in range(len(items))]
+
+
+def heapify_cases(n: int):
+    """Bottom-up heap construction and in-place heapsort against heapq and sorted()"""
+    # 1-tuples keep the NumPy fast path out of heapsort so the heap code is measured
+    rng = _rng('heapify', n)
+    keys = [(rng.random(),) for _ in range(n)]
+    return [
+        ('MinHeap(list)', lambda: keys, lambda items: MinHeap(items)),
+        ('MinHeap.build_heap', lambda: DynamicArray(keys), lambda da: MinHeap().build_heap(da)),
+        ('heapq.heapify', lambda: list(keys), heapq.heapify),
+        ('heapsort', lambda: DynamicArray(keys), heapsort),
+        ('heapq heapify+heappop', lambda: list(keys), _heapsort_heapq),
+        ('sorted', lambda: keys, lambda items: sorted(items, reverse=True)),
+    ]
+
+
+class _Counted:
+    """Float wrapper that counts every < comparison made on it"""
+    __slots__ = ('value',)
+    count = 0
+
+    def __init__(self, value: float) -> None:
+        self.value = value
+
+    def __lt__(self, other: '_Counted') -> bool:
+        _Counted.count += 1
+        return self.value < other.value
+
+
+def _drain_counted(heap) -> list:
+    """Empty a MinHeap or heapq list, checking it against sorted() and returning comparisons per element"""
+    _Counted.count = 0
+    if isinstance(heap, MinHeap):
+        result = [heap.remove_min().value for _ in range(heap.size())]
+    else:
+        result = [heapq.heappop(heap).value for _ in range(len(heap))]
+    assert result == sorted(result), "heap returned elements out of order"
+    return _Counted.count
+
+
+def comparisons_cases(n: int):
+    """
+    Randomized remove_min against heapq.heappop on random, sorted and duplicate-heavy keys.
+    Prints the comparisons per element next to the timing; both sides must drain in sorted order.
+    """
+    rng = _rng('comparisons', n)
+    inputs = {
+        'random': [rng.random() for _ in range(n)],
+        'sorted': [float(i) for i in range(n)],
+        'duplicates': [float(rng.randrange(8)) for _ in range(n)],
+    }
+    cases = []
+    for label, keys in inputs.items():
+        cases.append((f'remove_min {label}', lambda k=keys: MinHeap([_Counted(v) for v in k]), _drain_counted))
+        cases.append((f'heappop {label}', lambda k=keys: _heapified([_Counted(v) for v in k]), _drain_counted))
+    return cases
+
+
+def _heapified(items: list) -> list:
+    heapq.heapify(items)
+    return items
+
+
+def _add_all(heap: MinHeap, keys: list) -> None:
+    for key in keys:
+        heap.add(key)
+
+
+def _remove_all(heap: MinHeap) -> None:
+    for _ in range(heap.size()):
+        heap.remove_min()
+
+
+def arity_cases(n: int):
+    """add / remove_min throughput of binary, 4-ary and 8-ary heaps"""
+    rng = _rng('arity', n)
+    keys = [rng.random() for _ in range(n)]
+    cases = []
+    for arity in (2, 4, 8):
+        cases.append((f'add d={arity}', lambda a=arity: MinHeap(arity=a), lambda heap: _add_all(heap, keys)))
+        cases.append((f'remove_min d={arity}', lambda a=arity: MinHeap(keys, arity=a), _remove_all))
+    return cases
+
+
+def _produce_consume(keys: list, producers: int, batch: int) -> None:
+    """Feed keys through a ConcurrentPriorityQueue from several producer threads to one consumer"""
+    pq = ConcurrentPriorityQueue()
+    share = len(keys) // producers
+
+    def produce(part: list) -> None:
+        if batch == 1:
+            for key in part:
+                pq.put(key)
+        else:
+            for start in range(0, len(part), batch):
+                pq.put_many(part[start:start + batch])
+
+    threads = [threading.Thread(target=produce, args=(keys[i * share:(i + 1) * share],)) for i in range(producers)]
+    for thread in threads:
+        thread.start()
+    remaining = share * producers
+    while remaining:
+        if batch == 1:
+            pq.get()
+            remaining -= 1
+        else:
+            remaining -= pq.get_many(batch).length()
+    for thread in threads:
+        thread.join()
+
+
+def contention_cases(n: int):
+    """ConcurrentPriorityQueue with 1-16 producer threads and one consumer, per item and batched"""
+    rng = _rng('contention', n)
+    keys = [rng.random() for _ in range(n)]
+    cases = []
+    for producers in (1, 2, 4, 8, 16):
+        cases.append((f'put/get p={producers}', lambda: keys,
+                      lambda items, p=producers: _produce_consume(items, p, 1)))
+        cases.append((f'put_many/get_many p={producers}', lambda: keys,
+                      lambda items, p=producers: _produce_consume(items, p, 64)))
+    return cases
+
+
+# suite name -> (case factory, default sizes)
+SUITES = {
+    'array_ops': (array_ops_cases, [10 ** 3, 10 ** 4]),
+    'heap_ops': (heap_ops_cases, [10 ** 3, 10 ** 4, 10 ** 5]),
+    'streaming': (streaming_cases, [10 ** 4, 10 ** 5]),
+    'block_copy': (block_copy_cases, [10 ** 3, 10 ** 5, 10 ** 7]),
+    'parallel': (parallel_cases, [10 ** 4, 10 ** 5]),
+    'heapify': (heapify_cases, [10 ** 3, 10 ** 5]),
+    'arity': (arity_cases, [10 ** 4, 10 ** 5, 10 ** 6]),
+    'contention': (contention_cases, [10 ** 4, 10 ** 5]),
+    'comparisons': (comparisons_cases, [10 ** 3, 10 ** 5]),
+}
+
+
+def _profile(setup, run) -> None:
+    """Run run(setup()) once under cProfile and print the functions with the most own time"""
+    state = setup()
+    profiler = cProfile.Profile()
+    profiler.runcall(run, state)
+    pstats.Stats(profiler).sort_stats('tottime').print_stats(8)
+
+
+def _compare(results: list, baseline_path: str, threshold: float) -> int:
+    """
+    Print every case found in the baseline file with its change in ns/element.
+
+    Returns:
+    int: The number of cases slower than the baseline by more than threshold (0.1 = 10%).
+    """
+    with open(baseline_path) as file:
+        baseline = {(r['suite'], r['case'], r['n']): r['ns_per_element'] for r in json.load(file)['results']}
+    regressions = 0
+    print(f"\n{'case':<28}{'n':>12}{'baseline':>12}{'current':>12}{'change':>10}")
+    for result in results:
+        before = baseline.get((result['suite'], result['case'], result['n']))
+        if before is None:
+            continue
+        change = result['ns_per_element'] / before - 1
+        flag = ''
+        if change > threshold:
+            flag = '  REGRESSION'
+            regressions += 1
+        print(f"{result['case']:<28}{result['n']:>12}{before:>12.2f}{result['ns_per_element']:>12.2f}"
+              f"{change:>+10.1%}{flag}")
+    print(f"{regressions} regression(s) above {threshold:.0%}")
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--suite', nargs='+', choices=sorted(SUITES), default=sorted(SUITES))
+    parser.add_argument('--sizes', type=int, nargs='+', help="override the suite's default sizes")
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--seed', type=int, default=0, help="seed for the suites' random inputs")
+    parser.add_argument('--json', metavar='PATH', help="write the results to a JSON file")
+    parser.add_argument('--compare', metavar='PATH', help="JSON results of an earlier run to compare against")
+    parser.add_argument('--threshold', type=float, default=0.1, help="slowdown flagged by --compare")
+    parser.add_argument('--profile', action='store_true', help="profile each case once instead of timing it")
+    args = parser.parse_args()
+    global _seed
+    _seed = args.seed
+
+    counted = 'comparisons' in args.suite
+    if not args.profile:
+        print(f"{'case':<28}{'n':>12}{'ns/element':>14}" + (f"{'cmp/element':>14}" if counted else ''))
+    results = []
+    for suite in args.suite:
+        cases, default_sizes = SUITES[suite]
+        for n in args.sizes or default_sizes:
+            for name, setup, run in cases(n):
+                if args.profile:
+                    print(f"--- {suite}: {name}, n={n}")
+                    _profile(setup, run)
+                    continue
+                seconds, result = _best_time(setup, run, args.repeat)
+                # cases that count comparisons return the count, the others return None or their output
+                extra = f"{result / n:>14.2f}" if suite == 'comparisons' else ''
+                print(f"{name:<28}{n:>12}{seconds * 1e9 / n:>14.2f}{extra}")
+                results.append({'suite': suite, 'case': name, 'n': n, 'ns_per_element': seconds * 1e9 / n})
+
+    if args.json:
+        meta = {'python': platform.python_version(), 'platform': platform.platform(),
+                'numpy': numpy_backend.available(), 'repeat': args.repeat, 'seed': args.seed,
+                'time': time.strftime('%Y-%m-%dT%H:%M:%S')}
+        with open(args.json, 'w') as file:
+            json.dump({'meta': meta, 'results': results}, file, indent=1)
+    if args.compare and _compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
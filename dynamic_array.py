@@ -1,21 +1,282 @@
+from array import array
+from collections import Counter
+import mmap
+import os
+import pickle
+import struct
+import sys
+import time
 from static_array import StaticArray
+import numpy_backend
 
 class DynamicArrayException(Exception):
     """Custom exception class to be used by Dynamic Array
 DO NOT CHANGE THIS CLASS IN ANY WAY"""
     pass
 
+class _BlockCopyMixin:
+    """Bulk copy_block() primitive shared by the backing stores. Both keep their
+    slots in a _data sequence, so whole blocks move with one slice assignment"""
+    def copy_block(self, src_index: int, dest, dest_index: int, count: int) -> None:
+        """Copy count slots starting at src_index into dest starting at dest_index.
+        Overlapping ranges in the same array are handled like memmove"""
+        if count <= 0:
+            return
+        dest.write_block(dest_index, self.read_block(src_index, count))
+    def read_block(self, index: int, count: int):
+        """Return a copy of count slots starting at index as a list or array"""
+        if index < 0 or count < 0 or index + count > self._size:
+            raise DynamicArrayException("Block out of bounds")
+        return self._data[index:index + count]
+    def write_block(self, index: int, block) -> None:
+        """Store the values of a sized block (list or array) starting at index"""
+        block = self._coerce_block(block)
+        if index < 0 or index + len(block) > self._size:
+            raise DynamicArrayException("Block out of bounds")
+        self._data[index:index + len(block)] = block
+
+class _BlockStaticArray(_BlockCopyMixin, StaticArray):
+    """StaticArray (slots in its _data list) with the copy_block() primitive"""
+    def _coerce_block(self, block):
+        return block
+
+class _TypedStaticArray(_BlockCopyMixin):
+    """Fixed-size counterpart of StaticArray that keeps its slots in one
+    contiguous array.array of the given typecode instead of boxed objects"""
+    __slots__ = ('_size', '_data')
+    def __init__(self, size: int, typecode: str) -> None:
+        if size < 1:
+            raise DynamicArrayException("Array size must be a positive integer")
+        self._size = size
+        # bytes initializer zero-fills the buffer for every typecode
+        self._data = array(typecode, bytes(size * array(typecode).itemsize))
+    def __str__(self) -> str:
+        return f"STAT_ARR Size: {self._size} {self._data.tolist()}"
+    def __iter__(self):
+        return iter(self._data)
+    def get(self, index: int) -> object:
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException("Index out of bounds")
+        return self._data[index]
+    def set(self, index: int, value: object) -> None:
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException("Index out of bounds")
+        self._data[index] = value
+    def __getitem__(self, index: int) -> object:
+        return self.get(index)
+    def __setitem__(self, index: int, value: object) -> None:
+        self.set(index, value)
+    def length(self) -> int:
+        return self._size
+    def _coerce_block(self, block):
+        # array slice assignment only accepts an array of the same typecode
+        if isinstance(block, array) and block.typecode == self._data.typecode:
+            return block
+        return array(self._data.typecode, block)
+
+class _MappedStaticArray(_TypedStaticArray):
+    """Typed backing store whose slots live in a memory-mapped file, created by
+    DynamicArray.load(mmap_mode=...). Pages are read in by the OS on first access"""
+    __slots__ = ('_mapping',)
+    def __init__(self, mapping: mmap.mmap, offset: int, size: int, typecode: str) -> None:
+        self._size = size
+        self._mapping = mapping     # keeps the mapping open as long as the store lives
+        self._data = memoryview(mapping)[offset:offset + size * array(typecode).itemsize].cast(typecode)
+    def __str__(self) -> str:
+        return f"MAPPED_ARR Size: {self._size} {self._data.tolist()}"
+    def set(self, index: int, value: object) -> None:
+        if self._data.readonly:
+            raise DynamicArrayException("Array is mapped read-only")
+        super().set(index, value)
+    def read_block(self, index: int, count: int):
+        # copy out of the mapping so the block stays valid like an array slice would
+        if index < 0 or count < 0 or index + count > self._size:
+            raise DynamicArrayException("Block out of bounds")
+        block = array(self._data.format)
+        block.frombytes(self._data[index:index + count].cast('B'))
+        return block
+    def write_block(self, index: int, block) -> None:
+        if self._data.readonly:
+            raise DynamicArrayException("Array is mapped read-only")
+        super().write_block(index, block)
+
+# save() file header: magic, format version, typecode (0 for object storage), item size,
+# byte order (0 little, 1 big), size, capacity, reserved. 32 bytes keeps the typed payload
+# aligned for every item size when the file is memory-mapped
+_FILE_HEADER = struct.Struct('<4sBBBBQQQ')
+_FILE_MAGIC = b'DYNA'
+_FILE_VERSION = 1
+_BYTE_ORDER = 0 if sys.byteorder == 'little' else 1
+
+class DynamicArrayIterator:
+    """
+    Cursor over a DynamicArray created by iter() or reversed(). It reads the backing
+    store directly and re-checks the live size on every step, so like the original
+    iteration it sees appends and stops early if elements are removed.
+    """
+    __slots__ = ('_array', '_index', '_step')
+
+    def __init__(self, array: 'DynamicArray', reverse: bool = False) -> None:
+        self._array = array
+        self._index = array._size - 1 if reverse else 0
+        self._step = -1 if reverse else 1
+
+    def __iter__(self):
+        return self
+
+    def __next__(self) -> object:
+        index = self._index
+        array = self._array
+        if not 0 <= index < array._size:
+            raise StopIteration
+        self._index = index + self._step
+        # array._data is the backing store, whose _data is the raw list or array.array
+        return array._data._data[index]
+
+    def __length_hint__(self) -> int:
+        if self._step > 0:
+            return max(self._array._size - self._index, 0)
+        return max(min(self._index + 1, self._array._size), 0)
+
+class ResizePolicy:
+    """
+        Capacity growth and shrink rules used by DynamicArray.
+
+        The defaults reproduce the original behaviour: start at 4, double when full, and
+        when the size drops below 1/4 of a capacity greater than 10, shrink to twice the
+        size but not below 10.
+
+        Args:
+        - growth_factor (float): Multiplier applied to a full capacity (e.g. 1.5 or 2).
+        - chunk_size (int): If non-zero, grow by this fixed number of slots instead.
+        - shrink_threshold (float): Shrink once size < capacity * shrink_threshold.
+        - shrink_factor (float): A shrink leaves room for size * shrink_factor elements.
+          Keeping shrink_threshold * shrink_factor below 1 leaves a hysteresis gap so
+          alternating appends and removals do not resize every time.
+        - min_capacity (int): Capacity never shrinks below this (and only shrinks above it).
+        - initial_capacity (int): Capacity of a newly created array.
+        """
+    def __init__(self, growth_factor: float = 2, chunk_size: int = 0, shrink_threshold: float = 0.25,
+                 shrink_factor: float = 2, min_capacity: int = 10, initial_capacity: int = 4) -> None:
+        if chunk_size < 0 or (chunk_size == 0 and growth_factor <= 1):
+            raise DynamicArrayException("Growth needs growth_factor > 1 or a positive chunk_size")
+        if not 0 <= shrink_threshold < 1 or shrink_factor < 1 or min_capacity < 1 or initial_capacity < 1:
+            raise DynamicArrayException("Invalid shrink settings")
+        self.growth_factor = growth_factor
+        self.chunk_size = chunk_size
+        self.shrink_threshold = shrink_threshold
+        self.shrink_factor = shrink_factor
+        self.min_capacity = min_capacity
+        self.initial_capacity = initial_capacity
+
+    def grow(self, capacity: int, required: int) -> int:
+        """Return the capacity to grow to so that required elements fit"""
+        if capacity >= required:
+            return capacity
+        if self.chunk_size:
+            chunks = -(-(required - capacity) // self.chunk_size)
+            return capacity + chunks * self.chunk_size
+        while capacity < required:
+            capacity = max(int(capacity * self.growth_factor), capacity + 1)
+        return capacity
+
+    def shrink(self, capacity: int, size: int) -> int:
+        """Return the capacity to shrink to for size elements, or capacity if no shrink is due"""
+        if capacity > self.min_capacity and size < int(capacity * self.shrink_threshold):
+            return max(int(size * self.shrink_factor), self.min_capacity)
+        return capacity
+
+_DEFAULT_POLICY = ResizePolicy()
+
+class OperationStats:
+    """
+        Opt-in operation counters and latency samples, created by enable_stats() on a
+        DynamicArray or MinHeap. Instrumented methods only test for it once per call,
+        so arrays and heaps without stats pay next to nothing.
+
+        Counters (missing until the first event): 'resizes', 'elements_copied' (by
+        resizes), 'inserts' / 'insert_shifts' and 'removes' / 'remove_shifts'
+        (elements moved by insert_at_index / remove_at_index), and for heaps
+        'comparisons' and 'swaps' (levels an element moved in a sift).
+
+        With sample_every=n every n-th instrumented call is timed; its latency is
+        aggregated per operation and passed to callback(operation, seconds).
+        """
+    __slots__ = ('counts', 'latency', 'sample_every', 'callback', '_calls')
+
+    def __init__(self, sample_every: int = 0, callback=None) -> None:
+        if sample_every < 0:
+            raise DynamicArrayException("sample_every must not be negative")
+        self.counts = Counter()
+        self.latency = {}       # operation -> [samples, total seconds, max seconds]
+        self.sample_every = sample_every
+        self.callback = callback
+        self._calls = 0
+
+    def start(self) -> float:
+        """Return the start time if this call is sampled, otherwise None"""
+        if not self.sample_every:
+            return None
+        self._calls += 1
+        if self._calls % self.sample_every:
+            return None
+        return time.perf_counter()
+
+    def finish(self, operation: str, started: float) -> None:
+        """Record the latency of a call that start() chose to sample"""
+        if started is None:
+            return
+        seconds = time.perf_counter() - started
+        record = self.latency.get(operation)
+        if record is None:
+            self.latency[operation] = [1, seconds, seconds]
+        else:
+            record[0] += 1
+            record[1] += seconds
+            if seconds > record[2]:
+                record[2] = seconds
+        if self.callback is not None:
+            self.callback(operation, seconds)
+
+    def snapshot(self, reset: bool = False) -> dict:
+        """
+            Return the counters plus a 'latency' dict of {operation: {'samples', 'mean', 'max'}}
+            in seconds. With reset=True everything is zeroed afterwards, e.g. per request.
+            """
+        result = dict(self.counts)
+        result['latency'] = {operation: {'samples': samples, 'mean': total / samples, 'max': longest}
+                             for operation, (samples, total, longest) in self.latency.items()}
+        if reset:
+            self.counts.clear()
+            self.latency.clear()
+        return result
+
 class DynamicArray:
-    def __init__(self, start_array=None):
-        """Initialize new dynamic array DO NOT CHANGE THIS METHOD IN ANY WAY"""
+    # no per-instance __dict__: many small arrays are kept alive at once
+    __slots__ = ('_policy', '_size', '_capacity', '_typecode', '_resize_count', '_copied_count',
+                 '_peak_capacity', '_generation', '_data', '_stats')
+
+    def __init__(self, start_array=None, typecode: str = None, policy: ResizePolicy = None):
+        """Initialize new dynamic array.
+        An optional array module typecode (e.g. 'd' or 'q') stores the elements
+        in a contiguous typed buffer instead of a StaticArray of Python objects.
+        An optional ResizePolicy replaces the default doubling / quarter-shrink rules"""
+        self._policy = policy if policy is not None else _DEFAULT_POLICY
         self._size = 0
-        self._capacity = 4
-        self._data = StaticArray(self._capacity)
+        self._capacity = self._policy.initial_capacity
+        self._typecode = typecode
+        # counters reported by resize_stats()
+        self._resize_count = 0
+        self._copied_count = 0
+        self._peak_capacity = self._capacity
+        # bumped whenever storage is reallocated or elements move, see view()
+        self._generation = 0
+        self._stats = None      # OperationStats while enable_stats() is in effect
+        self._data = self._new_storage(self._capacity)
         # populate dynamic array with initial values (if provided)
         # before using this feature, implement append() method
         if start_array is not None:
-            for value in start_array:
-                self.append(value)
+            self.extend(start_array)
     def __str__(self) -> str:
         """Return content of dynamic array in human-readable form
         DO NOT CHANGE THIS METHOD IN ANY WAY"""
@@ -24,19 +285,12 @@ class DynamicArray:
         out += ', '.join([str(self._data[_]) for _ in range(self._size)])
         return out + ']'
     def __iter__(self):
-        """Create iterator for loop
-    DO NOT CHANGE THIS METHOD IN ANY WAY"""
-        self._index = 0
-        return self
-    def __next__(self):
-        """Obtain next value and advance iterator
-        DO NOT CHANGE THIS METHOD IN ANY WAY"""
-        try:
-            value = self[self._index]
-        except DynamicArrayException:
-            raise StopIteration
-        self._index += 1
-        return value
+        """Create an independent iterator for loop, so nested loops and
+        concurrent iterations over the same array do not share a cursor"""
+        return DynamicArrayIterator(self)
+    def __reversed__(self):
+        """Create an independent iterator that walks the array back to front"""
+        return DynamicArrayIterator(self, reverse=True)
     def get_at_index(self, index: int) -> object:
         """Return value from given index position. Invalid index raises DynamicArrayException
         DO NOT CHANGE THIS METHOD IN ANY WAY"""
@@ -87,6 +341,145 @@ DO NOT CHANGE THIS METHOD IN ANY WAY"""
 
         print(f"Length: {self._size}, Capacity: {self._capacity}, {self._data}")
 
+    def get_policy(self) -> ResizePolicy:
+        """Return the ResizePolicy that governs growth and shrinking"""
+
+        return self._policy
+
+    def resize_stats(self) -> dict:
+        """
+            Return the amortization counters collected since the array was created.
+
+            Returns:
+            - dict: 'resizes' (number of reallocations), 'elements_copied' (elements moved
+              by those reallocations), 'peak_capacity', plus the current 'capacity' and 'size'.
+            """
+        return {'resizes': self._resize_count, 'elements_copied': self._copied_count,
+                'peak_capacity': self._peak_capacity, 'capacity': self._capacity, 'size': self._size}
+
+    def enable_stats(self, sample_every: int = 0, callback=None) -> OperationStats:
+        """
+            Start counting resizes and element shifts, see OperationStats.
+
+            Args:
+            - sample_every (int): Time every n-th resize / insert / remove call, 0 for none.
+            - callback (function): Called as callback(operation, seconds) for each timed call.
+
+            Returns:
+            - OperationStats: The live collector, also readable through stats().
+            """
+        self._stats = OperationStats(sample_every, callback)
+        return self._stats
+
+    def disable_stats(self) -> None:
+        """Stop collecting stats and drop the collected ones"""
+        self._stats = None
+
+    def stats(self, reset: bool = False) -> dict:
+        """Return a snapshot of the collected stats (see OperationStats.snapshot), or {} if disabled"""
+        if self._stats is None:
+            return {}
+        return self._stats.snapshot(reset)
+
+    def get_typecode(self) -> str:
+        """Return the array module typecode of a typed array, or None for object storage"""
+
+        return self._typecode
+
+    def buffer(self) -> memoryview:
+        """
+            Return a writable memoryview over the live elements of a typed array.
+
+            The view shares memory with the array, so NumPy (numpy.asarray) and other
+            buffer consumers can wrap it without copying. A resize allocates a new
+            buffer, so views taken before it keep pointing at the old storage.
+
+            Raises:
+            - DynamicArrayException: If the array uses plain object storage.
+            """
+        if self._typecode is None:
+            raise DynamicArrayException("Only typed arrays expose a buffer")
+        return memoryview(self._data._data)[:self._size]
+
+    def __buffer__(self, flags: int) -> memoryview:
+        """Buffer protocol hook (Python 3.12+), same as buffer()"""
+        return self.buffer()
+
+    def __array__(self, dtype=None, copy=None):
+        """
+            Convert the array for numpy.asarray / numpy.array.
+
+            A typed array whose elements are in one piece is wrapped without copying. Object
+            storage, a wrapped ring or a dtype conversion always copies, so copy=False raises
+            ValueError for those (as NumPy requires); copy=True always returns a copy.
+            """
+        import numpy
+        zero_copy = self._typecode is not None and self._contiguous()
+        if zero_copy:
+            result = numpy.asarray(self.buffer())
+        elif copy is False:
+            raise ValueError("DynamicArray cannot be converted to a NumPy array without a copy")
+        else:
+            result = numpy.asarray(self._data.read_block(0, self._size))
+        if dtype is not None and result.dtype != numpy.dtype(dtype):
+            if copy is False:
+                raise ValueError("DynamicArray cannot be converted to the requested dtype without a copy")
+            return result.astype(dtype)
+        if copy and zero_copy:
+            return result.copy()
+        return result
+
+    def _contiguous(self) -> bool:
+        """Return True if the elements sit in order in one piece of the backing store"""
+        return True
+
+    def _raw(self):
+        """
+            Return the raw list / array.array behind the elements, for internal hot loops.
+
+            Indexes are not bounds-checked against the size, and the reference goes stale
+            after the next resize, so callers must re-fetch it after any append or remove.
+            """
+        return self._data._data
+
+    def _new_storage(self, capacity: int):
+        """Allocate backing storage of the given capacity for the current mode"""
+        if self._typecode is None:
+            return _BlockStaticArray(capacity)
+        return _TypedStaticArray(capacity, self._typecode)
+
+    def _drop_typecode(self) -> None:
+        """Move a typed array over to object storage, keeping its elements"""
+        new_data = _BlockStaticArray(self._capacity)
+        self._data.copy_block(0, new_data, 0, self._size)
+        self._data = new_data
+        self._typecode = None
+        self._generation += 1
+
+    def _append_capacity(self, required: int) -> int:
+        """Return the capacity that repeated append() growth reaches for required elements"""
+        return self._policy.grow(self._capacity, required)
+
+    def _grow_to(self, required: int) -> None:
+        """Resize at most once so that required elements fit"""
+        if required > self._capacity:
+            self.resize(self._append_capacity(required))
+
+    def _check_fits(self, value: object) -> None:
+        """Raise TypeError / OverflowError up front if value cannot be stored in this typed array"""
+        if self._typecode is not None:
+            array(self._typecode, [value])
+
+    def _as_block(self, iterable):
+        """Return the values of iterable as a sized list or array coerced to this array's storage"""
+        if isinstance(iterable, DynamicArray):
+            block = iterable._data.read_block(0, iterable._size)
+        elif isinstance(iterable, (list, array)):
+            block = iterable
+        else:
+            block = list(iterable)
+        return self._data._coerce_block(block)
+
 
 # -----------------------------------------------------------------------
     def resize(self, new_capacity: int) -> None:  #passes the prescribed tests
@@ -96,12 +489,39 @@ DO NOT CHANGE THIS METHOD IN ANY WAY"""
         if new_capacity <= 0 or new_capacity < self._size:
             return  # Do nothing and exit if new_capacity is not valid
 
-        new_data = StaticArray(new_capacity)
-        for index in range(self._size):
-            new_data.set(index, self._data.get(index))
+        stats = self._stats
+        if stats is not None:
+            started = stats.start()
+        new_data = self._new_storage(new_capacity)
+        self._copy_elements_to(new_data)
 
         self._data = new_data
         self._capacity = new_capacity
+        self._resize_count += 1
+        self._generation += 1
+        self._copied_count += self._size
+        if new_capacity > self._peak_capacity:
+            self._peak_capacity = new_capacity
+        if stats is not None:
+            stats.counts['resizes'] += 1
+            stats.counts['elements_copied'] += self._size
+            stats.finish('resize', started)
+
+    def _copy_elements_to(self, new_data) -> None:
+        """Copy the elements, in order, to the start of freshly allocated storage"""
+        self._data.copy_block(0, new_data, 0, self._size)
+
+    def reserve(self, capacity: int) -> None:
+        """Grow the capacity to at least the given number of elements in a single resize"""
+
+        if capacity > self._capacity:
+            self.resize(capacity)
+
+    def shrink_to_fit(self) -> None:
+        """Reduce the capacity to the current number of elements (at least 1)"""
+
+        if self._capacity > max(self._size, 1):
+            self.resize(max(self._size, 1))
 
     def append(self, value: object) -> None: #passes the prescribed tests
         """
@@ -111,15 +531,14 @@ DO NOT CHANGE THIS METHOD IN ANY WAY"""
             - value (object): The value to append to the dynamic array.
 
             If the internal storage is full (the size equals the capacity), this method
-            doubles the capacity of the dynamic array to accommodate the new element.
+            grows the capacity as the ResizePolicy dictates (doubling by default).
 
             Returns:
             None
             """
         if self._size == self._capacity:
-            # If the internal storage is full, double its capacity
-            new_capacity = self._capacity * 2 if self._capacity > 0 else 1
-            self.resize(new_capacity)
+            # If the internal storage is full, grow it
+            self.resize(self._policy.grow(self._capacity, self._size + 1))
 
         self._data.set(self._size, value)
         self._size += 1
@@ -133,32 +552,42 @@ DO NOT CHANGE THIS METHOD IN ANY WAY"""
             - value (object): The value to insert in the dynamic array.
 
             If the internal storage is full (the size equals the capacity), this method
-            doubles the capacity of the dynamic array to accommodate the new element.
+            grows the capacity as the ResizePolicy dictates (doubling by default).
             The elements at and after the specified index are shifted to make space for
             the new value.
 
             Raises:
             - DynamicArrayException: If the provided index is invalid (negative or
               greater than the current size).
+            - TypeError / OverflowError: If a typed array cannot store value; the
+              array is left unchanged.
 
             Returns:
             None
             """
         if index < 0 or index > self._size:
             raise DynamicArrayException("Invalid index")
+        # a value the typecode rejects must fail before any element has moved
+        self._check_fits(value)
 
+        stats = self._stats
+        if stats is not None:
+            started = stats.start()
         if self._size == self._capacity:
-            # If the internal storage is full, double its capacity
-            new_capacity = self._capacity * 2 if self._capacity > 0 else 1
-            self.resize(new_capacity)
+            # If the internal storage is full, grow it
+            self.resize(self._policy.grow(self._capacity, self._size + 1))
 
         # Shift elements to the right to make space for the new value
-        for i in range(self._size, index, -1):
-            self._data.set(i, self._data.get(i - 1))
+        self._data.copy_block(index, self._data, index + 1, self._size - index)
 
         # Insert the new value at the specified index
         self._data.set(index, value)
         self._size += 1
+        self._generation += 1
+        if stats is not None:
+            stats.counts['inserts'] += 1
+            stats.counts['insert_shifts'] += self._size - 1 - index
+            stats.finish('insert_at_index', started)
 
     def remove_at_index(self, index: int) -> None:
         """
@@ -170,7 +599,7 @@ DO NOT CHANGE THIS METHOD IN ANY WAY"""
             If the size of the dynamic array is strictly less than 1/4 of its current
             capacity and the current capacity is greater than 10, this method reduces
             the capacity to twice the number of current elements, ensuring that the
-            final capacity is at least 10.
+            final capacity is at least 10. A custom ResizePolicy changes these numbers.
 
             The elements after the specified index are shifted to fill the removed element's
             position, and the size is decremented.
@@ -185,18 +614,23 @@ DO NOT CHANGE THIS METHOD IN ANY WAY"""
         if index < 0 or index >= self._size:
             raise DynamicArrayException("Invalid index")
 
-        if self._capacity > 10 and self._size < self._capacity // 4:
-            new_capacity = self._size * 2  # Double the size
-            if new_capacity < 10:  # Ensure the new capacity is at least 10
-                new_capacity = 10
+        stats = self._stats
+        if stats is not None:
+            started = stats.start()
+        new_capacity = self._policy.shrink(self._capacity, self._size)
+        if new_capacity != self._capacity:
             self.resize(new_capacity)
 
         # Shift elements to the left to fill the removed element's position
-        for i in range(index, self._size - 1):
-            self._data.set(i, self._data.get(i + 1))
+        self._data.copy_block(index + 1, self._data, index, self._size - index - 1)
 
         # Decrement the size
         self._size -= 1
+        self._generation += 1
+        if stats is not None:
+            stats.counts['removes'] += 1
+            stats.counts['remove_shifts'] += self._size - index
+            stats.finish('remove_at_index', started)
 
     def slice(self, start_index: int, size: int) -> 'DynamicArray': #passes the prescribed tests.
         """
@@ -220,15 +654,43 @@ DO NOT CHANGE THIS METHOD IN ANY WAY"""
         if start_index + size > self._size:
             raise DynamicArrayException("Not enough elements to create the slice")
 
-        # Create a new DynamicArray for the slice
-        slice_array = DynamicArray()
+        # Create a new DynamicArray for the slice, sized as appending would size it
+        slice_array = DynamicArray(typecode=self._typecode, policy=self._policy)
+        slice_array._grow_to(size)
 
-        # Append the requested elements to the slice_array
-        for i in range(start_index, start_index + size):
-            slice_array.append(self._data.get(i))
+        # Copy the requested elements into the slice_array in one block
+        self._data.copy_block(start_index, slice_array._data, 0, size)
+        slice_array._size = size
 
         return slice_array
 
+    def view(self, start_index: int, size: int) -> 'DynamicArrayView':
+        """
+            Return a zero-copy window onto a slice of elements of the array.
+
+            Takes the same arguments and raises the same errors as slice(), but the result
+            shares this array's storage instead of copying it. Writes through the view are
+            visible in the array and vice versa. Once the array is resized, or elements are
+            inserted or removed, the view is stale and raises on every access.
+
+            Args:
+            - start_index (int): The starting index of the window.
+            - size (int): The number of elements in the window.
+
+            Returns:
+            - DynamicArrayView: A window onto the requested elements.
+
+            Raises:
+            - DynamicArrayException: If 'start_index' is out of range or 'size' is negative or the window extends beyond the dynamic array's size.
+            """
+        if start_index < 0 or start_index >= self._size or size < 0:
+            raise DynamicArrayException("Invalid start index or size")
+
+        if start_index + size > self._size:
+            raise DynamicArrayException("Not enough elements to create the view")
+
+        return DynamicArrayView(self, start_index, size)
+
     def merge(self, second_da: 'DynamicArray') -> None: #passes the prescribed tests
         """
             Merge the elements of another DynamicArray into the current DynamicArray.
@@ -240,12 +702,95 @@ DO NOT CHANGE THIS METHOD IN ANY WAY"""
 
             Returns:
             - None"""
-        # Loop through the elements in the second DynamicArray
-        for i in range(second_da.length()):
-            # Append each element to the current DynamicArray
-            self.append(second_da.get_at_index(i))
+        self.extend(second_da)
+
+    def extend(self, iterable, size_hint: int = None) -> None:
+        """
+            Append every value of an iterable to the end of the dynamic array.
+
+            The capacity grows at most once, to the value repeated append() calls would
+            have reached, and the values are written into the backing store in one block.
+
+            Args:
+            - iterable: A DynamicArray, list, array or any other iterable of values.
+            - size_hint (int): Expected number of values for iterables without len().
+              Capacity for them is reserved up front and the values are written straight
+              into the array instead of being collected into a temporary list first.
+
+            Returns:
+            - None"""
+        if size_hint is not None and not isinstance(iterable, DynamicArray) and not hasattr(iterable, '__len__'):
+            self._grow_to(self._size + size_hint)
+            for value in iterable:
+                self.append(value)
+            return
+
+        block = self._as_block(iterable)
+        self._grow_to(self._size + len(block))
+        self._data.write_block(self._size, block)
+        self._size += len(block)
+
+    def insert_many(self, index: int, iterable) -> None:
+        """
+            Insert every value of an iterable at the specified index, keeping their order.
+
+            The capacity grows at most once and the elements from index onward are
+            shifted right in one block, so inserting k values costs O(n + k).
+
+            Args:
+            - index (int): The index where the first value should be inserted.
+            - iterable: A DynamicArray, list, array or any other iterable of values.
+
+            Raises:
+            - DynamicArrayException: If the provided index is invalid (negative or
+              greater than the current size).
+
+            Returns:
+            - None"""
+        if index < 0 or index > self._size:
+            raise DynamicArrayException("Invalid index")
+
+        block = self._as_block(iterable)
+        count = len(block)
+        self._grow_to(self._size + count)
+
+        # Shift the tail right once, then fill the gap
+        self._data.copy_block(index, self._data, index + count, self._size - index)
+        self._data.write_block(index, block)
+        self._size += count
+        self._generation += 1
+
+    def remove_range(self, start: int, count: int) -> None:
+        """
+            Remove count elements starting at the specified index.
+
+            The elements after the range are shifted left in one block. Afterwards the
+            capacity shrinks at most once, following the ResizePolicy shrink rule used by
+            remove_at_index().
+
+            Args:
+            - start (int): The index of the first element to remove.
+            - count (int): The number of elements to remove.
+
+            Raises:
+            - DynamicArrayException: If start is out of range, count is negative or the
+              range extends beyond the dynamic array's size.
+
+            Returns:
+            - None"""
+        if start < 0 or start >= self._size or count < 0 or start + count > self._size:
+            raise DynamicArrayException("Invalid start index or count")
+
+        # Shift the tail left once over the removed range
+        self._data.copy_block(start + count, self._data, start, self._size - start - count)
+        self._size -= count
+        self._generation += 1
 
-    def map(self, map_func) -> 'DynamicArray': #passes both prescribed tests
+        new_capacity = self._policy.shrink(self._capacity, self._size)
+        if new_capacity != self._capacity:
+            self.resize(new_capacity)
+
+    def map(self, map_func, typecode: str = None) -> 'DynamicArray': #passes both prescribed tests
         """
             Create a new DynamicArray by applying a mapping function to each element.
 
@@ -257,13 +802,36 @@ DO NOT CHANGE THIS METHOD IN ANY WAY"""
                 This function should take one argument, which is an element from the current DynamicArray, and return
                 the transformed value.
 
+            - typecode (str): Optional array module typecode for the result. By default the
+                result uses object storage, so the mapped values keep their Python types
+                (bools stay bools, ints stay ints) whatever the source storage is. With a
+                typecode the values are converted to it, and the result falls back to object
+                storage if one does not fit.
+
+            If NumPy is available, the array is numeric and map_func is a ufunc (or marked with
+            numpy_backend.vectorized), map_func is called once on the whole array instead.
+
             Returns:
             - DynamicArray: A new DynamicArray containing the mapped values."""
+        if numpy_backend.accepts(map_func):
+            values = numpy_backend.numeric_values(self, widen=True)
+            if values is not None:
+                result = map_func(values)
+                if getattr(result, 'shape', None) != values.shape:
+                    raise DynamicArrayException("Vectorized map_func must return one value per element")
+                typecode = numpy_backend.result_typecode(result, typecode)
+                return DynamicArray(numpy_backend.to_block(result, typecode), typecode=typecode, policy=self._policy)
+
         # Create a new DynamicArray to store the mapped values
-        mapped_array = DynamicArray()
+        mapped_array = DynamicArray(typecode=typecode, policy=self._policy)
         for i in range(self.length()):
             # Apply the map_func to each element and append the result to the new array
-            mapped_array.append(map_func(self.get_at_index(i)))
+            value = map_func(self.get_at_index(i))
+            try:
+                mapped_array.append(value)
+            except (TypeError, OverflowError):
+                mapped_array._drop_typecode()
+                mapped_array.append(value)
         return mapped_array
 
     def filter(self, filter_func): #passes the prescribed tests
@@ -277,11 +845,20 @@ DO NOT CHANGE THIS METHOD IN ANY WAY"""
             - filter_func (function): The filtering function used to determine whether an element should be included
                 in the filtered DynamicArray. This function should take one argument (an element from the current DynamicArray)
                 and return a Boolean value (True if the element should be included, False if it should be excluded).
+                Instead of a function, a boolean mask (a sequence with one truth value per element) may be given.
+                With NumPy available and numeric data, ufunc-style predicates are called once on the whole array.
 
             Returns:
             - DynamicArray: A new DynamicArray containing the elements that satisfy the filter criteria."""
+        if not callable(filter_func):
+            return self._filter_mask(filter_func)
+        if numpy_backend.accepts(filter_func):
+            values = numpy_backend.numeric_values(self)
+            if values is not None:
+                return self._filter_mask(filter_func(values))
+
         # Create a new DynamicArray to store the filtered values
-        filtered_array = DynamicArray()
+        filtered_array = DynamicArray(typecode=self._typecode, policy=self._policy)
         for i in range(self.length()):
             element = self.get_at_index(i)
             # Apply the filter_func to each element
@@ -290,23 +867,47 @@ DO NOT CHANGE THIS METHOD IN ANY WAY"""
                 filtered_array.append(element)
         return filtered_array
 
+    def _filter_mask(self, mask) -> 'DynamicArray':
+        """Return a new DynamicArray with the elements whose mask entry is true"""
+        if isinstance(mask, DynamicArray):
+            mask = list(mask)
+        if len(mask) != self._size:
+            raise DynamicArrayException("Mask length does not match the array")
+
+        values = numpy_backend.numeric_values(self)
+        if values is not None:
+            selected = numpy_backend.select(values, mask)
+            return DynamicArray(numpy_backend.to_block(selected, self._typecode), typecode=self._typecode, policy=self._policy)
+
+        filtered_array = DynamicArray(typecode=self._typecode, policy=self._policy)
+        filtered_array.extend([value for value, keep in zip(self, mask) if keep])
+        return filtered_array
+
     def reduce(self, reduce_func, initializer=None): #passes the prescribed tests
         """
-            Create a new DynamicArray by filtering elements based on a given predicate function.
+            Fold the elements of the DynamicArray into a single value with a two-argument function.
 
-            Filters the elements of the current DynamicArray based on the provided 'filter_func' and stores
-            the elements that satisfy the filter criteria in a new DynamicArray, which is then returned.
+            Applies 'reduce_func' cumulatively from left to right, starting from 'initializer' if one is given
+            and from the first element otherwise.
 
             Args:
-            - filter_func (function): The filtering function used to determine whether an element should be included
-                in the filtered DynamicArray. This function should take one argument (an element from the current DynamicArray)
-                and return a Boolean value (True if the element should be included, False if it should be excluded).
+            - reduce_func (function): Takes the accumulated value and the next element and returns the new accumulated value.
+                With NumPy available and numeric data, binary ufuncs whose result does not depend on the
+                vectorized evaluation order (e.g. numpy.add, numpy.maximum) run as a single NumPy reduction.
+            - initializer: Optional starting value.
 
             Returns:
-            - DynamicArray: A new DynamicArray containing the elements that satisfy the filter criteria."""
+            - The accumulated value, or 'initializer' if the array is empty."""
         if self.is_empty():
             return initializer
 
+        if numpy_backend.accepts(reduce_func):
+            values = numpy_backend.numeric_values(self, widen=True)
+            if values is not None:
+                result = numpy_backend.vector_reduce(reduce_func, values, initializer)
+                if result is not None:
+                    return result
+
         if initializer is None:
             accumulator = self.get_at_index(0)
             start_index = 1
@@ -320,13 +921,605 @@ DO NOT CHANGE THIS METHOD IN ANY WAY"""
 
         return accumulator
 
+    def lazy(self) -> 'LazyPipeline':
+        """
+            Start a lazy map/filter/reduce pipeline over the array.
+
+            Stages chained on the result (e.g. arr.lazy().map(f).filter(g).reduce(h)) run
+            fused in a single pass when a terminal operation is called, without building
+            intermediate DynamicArrays.
+
+            Returns:
+            - LazyPipeline: A pipeline with no stages yet."""
+        return LazyPipeline(self)
+
+    def __getstate__(self) -> dict:
+        """Pickle only the live elements (raw bytes for typed arrays), not the spare capacity or stats"""
+        return {'typecode': self._typecode, 'policy': self._policy, 'capacity': self._capacity,
+                'stats': (self._resize_count, self._copied_count, self._peak_capacity),
+                'elements': self._data.read_block(0, self._size)}
+
+    def __setstate__(self, state: dict) -> None:
+        self._policy = state['policy']
+        self._typecode = state['typecode']
+        self._resize_count, self._copied_count, self._peak_capacity = state['stats']
+        self._generation = 0
+        self._stats = None
+        self._restore(state['elements'], state['capacity'])
+
+    def _restore(self, elements, capacity: int) -> None:
+        """Replace the storage with a block of elements at the given capacity, without resize()"""
+        self._size = len(elements)
+        self._capacity = max(capacity, self._size, 1)
+        self._data = self._new_storage(self._capacity)
+        self._data.write_block(0, elements)
+
+    def save(self, path) -> None:
+        """
+            Write the array to a binary file that load() reads back.
+
+            The file records size, capacity and typecode followed by the raw buffer
+            of a typed array, or a pickle of the elements for object storage. The
+            policy and resize statistics are not saved.
+
+            Args:
+            - path: File name or path-like object.
+            """
+        with open(path, 'wb') as file:
+            self._write_to(file)
+
+    def _write_to(self, file) -> None:
+        """Write the header and payload of save() to an open binary file"""
+        typecode = self._typecode
+        itemsize = array(typecode).itemsize if typecode is not None else 0
+        file.write(_FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, ord(typecode) if typecode else 0,
+                                     itemsize, _BYTE_ORDER, self._size, self._capacity, 0))
+        if typecode is not None:
+            file.write(self.buffer() if self._contiguous() else self._data.read_block(0, self._size))
+        else:
+            pickle.dump(self._data.read_block(0, self._size), file, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path, policy: ResizePolicy = None, mmap_mode: str = None) -> 'DynamicArray':
+        """
+            Read an array written by save().
+
+            Typed arrays can be memory-mapped instead of read: the elements then stay
+            in the file and the OS pages them in on access, so multi-GB files open
+            instantly. mmap_mode is 'r' (read-only), 'r+' (writes go to the file) or
+            'c' (copy-on-write, the file is never modified). A mapped array is copied
+            into memory the first time it has to resize.
+
+            Object-storage files are read with pickle.load(), which can run arbitrary
+            code: only load such files from a trusted source.
+
+            Args:
+            - path: File name or path-like object.
+            - policy (ResizePolicy): Resize policy of the loaded array, default doubling.
+            - mmap_mode (str): None to read the file, or 'r', 'r+' or 'c' to map it.
+
+            Returns:
+            - DynamicArray: The loaded array.
+
+            Raises:
+            - DynamicArrayException: If the file is not a saved DynamicArray or is truncated,
+              or mmap_mode is given for object storage or a file saved with the other byte order.
+            """
+        if mmap_mode not in (None, 'r', 'r+', 'c'):
+            raise DynamicArrayException("mmap_mode must be None, 'r', 'r+' or 'c'")
+        with open(path, 'rb' if mmap_mode in (None, 'r', 'c') else 'r+b') as file:
+            if mmap_mode is None:
+                return cls._read_from(file, policy)
+            typecode, byte_order, size, _ = cls._read_header(file)
+            if typecode is None:
+                raise DynamicArrayException("Only typed arrays can be memory-mapped")
+            if byte_order != _BYTE_ORDER:
+                raise DynamicArrayException("File was saved with the other byte order and cannot be mapped")
+            da = cls(typecode=typecode, policy=policy)
+            if size == 0:
+                return da
+            if os.fstat(file.fileno()).st_size < _FILE_HEADER.size + size * array(typecode).itemsize:
+                raise DynamicArrayException("Truncated DynamicArray file")
+            access = {'r': mmap.ACCESS_READ, 'r+': mmap.ACCESS_WRITE, 'c': mmap.ACCESS_COPY}[mmap_mode]
+            mapping = mmap.mmap(file.fileno(), 0, access=access)
+        da._data = _MappedStaticArray(mapping, _FILE_HEADER.size, size, typecode)
+        da._size = da._capacity = da._peak_capacity = size
+        return da
+
+    @classmethod
+    def _read_header(cls, file) -> tuple:
+        """Read and check a save() header, returning (typecode, byte_order, size, capacity)"""
+        header = file.read(_FILE_HEADER.size)
+        if len(header) != _FILE_HEADER.size:
+            raise DynamicArrayException("Truncated DynamicArray file")
+        magic, version, code, itemsize, byte_order, size, capacity, _ = _FILE_HEADER.unpack(header)
+        if magic != _FILE_MAGIC or version != _FILE_VERSION:
+            raise DynamicArrayException("Not a DynamicArray file, or an unsupported version")
+        typecode = chr(code) if code else None
+        if typecode is not None and array(typecode).itemsize != itemsize:
+            raise DynamicArrayException(f"Typecode {typecode!r} has a different item size on this platform")
+        return typecode, byte_order, size, capacity
+
+    @classmethod
+    def _read_from(cls, file, policy: ResizePolicy = None) -> 'DynamicArray':
+        """Read the header and payload of save() from an open binary file"""
+        typecode, byte_order, size, capacity = cls._read_header(file)
+        da = cls(typecode=typecode, policy=policy)
+        if typecode is not None:
+            elements = array(typecode)
+            try:
+                elements.fromfile(file, size)
+            except EOFError:
+                raise DynamicArrayException("Truncated DynamicArray file") from None
+            if byte_order != _BYTE_ORDER:
+                elements.byteswap()
+        else:
+            elements = pickle.load(file)
+        da._restore(elements, capacity)
+        da._peak_capacity = da._capacity
+        return da
+
+class _RingStore(_BlockCopyMixin):
+    """
+    Backing-store interface over the ring of a CircularDynamicArray, addressed from
+    its head: slot i of the store is element i of the array. The inherited
+    DynamicArray methods work through it unchanged, and wrapping blocks are split
+    into the part up to the end of the ring and the part from its start. Creating
+    one or reading through it never moves the elements.
+    """
+    __slots__ = ('_array',)
+
+    def __init__(self, array: 'CircularDynamicArray') -> None:
+        self._array = array
+
+    def __str__(self) -> str:
+        return f"RING_ARR Head: {self._array._head} {self._array._ring}"
+
+    def __iter__(self):
+        return (self.get(index) for index in range(self.length()))
+
+    def get(self, index: int) -> object:
+        if index < 0 or index >= self._array._capacity:
+            raise DynamicArrayException("Index out of bounds")
+        return self._array._ring.get(self._array._slot(index))
+
+    def set(self, index: int, value: object) -> None:
+        if index < 0 or index >= self._array._capacity:
+            raise DynamicArrayException("Index out of bounds")
+        self._array._ring.set(self._array._slot(index), value)
+
+    def __getitem__(self, index: int) -> object:
+        return self.get(index)
+
+    def __setitem__(self, index: int, value: object) -> None:
+        self.set(index, value)
+
+    def length(self) -> int:
+        return self._array._capacity
+
+    def _coerce_block(self, block):
+        return self._array._ring._coerce_block(block)
+
+    def read_block(self, index: int, count: int):
+        """Return a copy of count slots starting at index, joined across the wrap point"""
+        array = self._array
+        if index < 0 or count < 0 or index + count > array._capacity:
+            raise DynamicArrayException("Block out of bounds")
+        slot = array._slot(index) if count else 0
+        first = min(count, array._capacity - slot)
+        block = array._ring.read_block(slot, first)
+        if first < count:
+            block = block + array._ring.read_block(0, count - first)
+        return block
+
+    def write_block(self, index: int, block) -> None:
+        """Store a sized block starting at index, split across the wrap point"""
+        array = self._array
+        block = self._coerce_block(block)
+        if index < 0 or index + len(block) > array._capacity:
+            raise DynamicArrayException("Block out of bounds")
+        if not block:
+            return
+        slot = array._slot(index)
+        first = array._capacity - slot
+        if first >= len(block):
+            array._ring.write_block(slot, block)
+        else:
+            array._ring.write_block(slot, block[:first])
+            array._ring.write_block(0, block[first:])
+
+class _RingIterator(DynamicArrayIterator):
+    """DynamicArrayIterator that translates each index through the ring's head offset"""
+    __slots__ = ()
+
+    def __next__(self) -> object:
+        index = self._index
+        array = self._array
+        if not 0 <= index < array._size:
+            raise StopIteration
+        self._index = index + self._step
+        return array._ring._data[array._slot(index)]
+
+class CircularDynamicArray(DynamicArray):
+    """
+    DynamicArray whose elements may wrap around the end of the backing store, like a
+    ring buffer, so that queue / deque style use is cheap:
+
+    - insert_at_index(0, x) and remove_at_index(0) are O(1), like append and removing
+      the last element, by moving the head offset instead of shifting the elements.
+    - Other inserts and removals shift whichever side of the index is shorter (split
+      into two block copies where it wraps), so their cost is the distance to the
+      nearer end rather than to the back.
+    - get_at_index / set_at_index (and []) translate the index in O(1).
+
+    Everything else is inherited: the inherited methods reach the ring through a
+    _RingStore that translates indexes, so the indexed API behaves exactly like
+    DynamicArray and reading never moves elements. resize() unrolls the ring straight
+    into the new storage. buffer() needs the elements in one piece, see make_contiguous().
+    """
+    __slots__ = ('_ring', '_head')
+
+    @property
+    def _data(self) -> _RingStore:
+        """Backing store seen by the inherited methods, addressed from the head"""
+        return _RingStore(self)
+
+    @_data.setter
+    def _data(self, storage) -> None:
+        self._ring = storage
+        self._head = 0
+
+    def __iter__(self):
+        """Create an independent iterator that reads the ring in place"""
+        return _RingIterator(self)
+
+    def __reversed__(self):
+        """Create an independent iterator that walks the ring back to front"""
+        return _RingIterator(self, reverse=True)
+
+    def _slot(self, index: int) -> int:
+        """Return the ring slot of element index (0 <= index < capacity)"""
+        index += self._head
+        if index >= self._capacity:
+            index -= self._capacity
+        return index
+
+    def _contiguous(self) -> bool:
+        return self._head + self._size <= self._capacity
+
+    def make_contiguous(self) -> None:
+        """
+            Rotate the elements in O(n) so they no longer wrap around the end of the ring,
+            with element 0 in the first slot. Indexes do not change.
+            """
+        if self._head:
+            elements = self._data.read_block(0, self._size)
+            self._head = 0
+            self._ring.write_block(0, elements)
+
+    def buffer(self) -> memoryview:
+        """
+            Return a writable memoryview over the elements of a typed array, like
+            DynamicArray.buffer(). It shares memory with the ring, so it needs the elements
+            in one piece and goes stale once a front insert / remove moves the head.
+
+            Raises:
+            - DynamicArrayException: If the array uses object storage, or the elements wrap
+              around the end of the ring (call make_contiguous() first).
+            """
+        if self._typecode is None:
+            raise DynamicArrayException("Only typed arrays expose a buffer")
+        if not self._contiguous():
+            raise DynamicArrayException("Elements wrap around the ring; call make_contiguous() first")
+        return memoryview(self._ring._data)[self._head:self._head + self._size]
+
+    def _raw(self):
+        """
+            Return the raw ring with element 0 in slot 0, for internal hot loops that are
+            about to rewrite the elements in place (this may rotate the ring).
+            """
+        self.make_contiguous()
+        return self._ring._data
+
+    def _copy_elements_to(self, new_data) -> None:
+        """Unroll the ring into freshly allocated storage: the part up to the end, then the wrapped part"""
+        first = min(self._size, self._capacity - self._head)
+        self._ring.copy_block(self._head, new_data, 0, first)
+        self._ring.copy_block(0, new_data, first, self._size - first)
+
+    def get_at_index(self, index: int) -> object:
+        """Return value from given index position. Invalid index raises DynamicArrayException"""
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+        return self._ring[self._slot(index)]
+
+    def set_at_index(self, index: int, value: object) -> None:
+        """Store value at given index in the array. Invalid index raises DynamicArrayException"""
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+        self._ring[self._slot(index)] = value
+
+    def append(self, value: object) -> None:
+        """Append value after the last element, growing as the ResizePolicy dictates"""
+        if self._size == self._capacity:
+            self.resize(self._policy.grow(self._capacity, self._size + 1))
+        self._ring.set(self._slot(self._size), value)
+        self._size += 1
+
+    def insert_at_index(self, index: int, value: object) -> None:
+        """
+            Insert value at index like DynamicArray.insert_at_index(), shifting only the
+            elements between index and the nearer end (none at either end).
+
+            Raises:
+            - DynamicArrayException: If index is negative or greater than the size.
+            - TypeError / OverflowError: If a typed array cannot store value; the
+              array is left unchanged.
+            """
+        if index < 0 or index > self._size:
+            raise DynamicArrayException("Invalid index")
+        # a value the typecode rejects must fail before any element has moved
+        self._check_fits(value)
+
+        stats = self._stats
+        if stats is not None:
+            started = stats.start()
+        if self._size == self._capacity:
+            self.resize(self._policy.grow(self._capacity, self._size + 1))
+
+        store = self._data
+        size = self._size
+        if index <= size - index:
+            # move the head back one slot and the elements before index down with it
+            front = store.read_block(0, index) if index else None
+            self._head = self._head - 1 if self._head else self._capacity - 1
+            if index:
+                store.write_block(0, front)
+            shifted = index
+        else:
+            # move the elements from index on up one slot
+            store.copy_block(index, store, index + 1, size - index)
+            shifted = size - index
+        self._ring.set(self._slot(index), value)
+        self._size += 1
+        self._generation += 1
+        if stats is not None:
+            stats.counts['inserts'] += 1
+            stats.counts['insert_shifts'] += shifted
+            stats.finish('insert_at_index', started)
+
+    def remove_at_index(self, index: int) -> None:
+        """
+            Remove the element at index like DynamicArray.remove_at_index(), shifting only
+            the elements between index and the nearer end (none at either end).
+
+            Raises:
+            - DynamicArrayException: If index is negative or not less than the size.
+            """
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException("Invalid index")
+
+        stats = self._stats
+        if stats is not None:
+            started = stats.start()
+        new_capacity = self._policy.shrink(self._capacity, self._size)
+        if new_capacity != self._capacity:
+            self.resize(new_capacity)
+
+        store = self._data
+        after = self._size - index - 1
+        if index < after:
+            # move the elements before index up one slot and the head with them
+            front = store.read_block(0, index) if index else None
+            self._head = self._head + 1 if self._head + 1 < self._capacity else 0
+            if index:
+                store.write_block(0, front)
+            shifted = index
+        else:
+            # move the elements after index down one slot
+            store.copy_block(index + 1, store, index, after)
+            shifted = after
+        self._size -= 1
+        self._generation += 1
+        if stats is not None:
+            stats.counts['removes'] += 1
+            stats.counts['remove_shifts'] += shifted
+            stats.finish('remove_at_index', started)
+
+class DynamicArrayView:
+    """
+    Zero-copy window onto size elements of a DynamicArray starting at start, created
+    by DynamicArray.view(). It remembers the parent's generation counter and raises
+    DynamicArrayException instead of reading moved or reallocated storage.
+    """
+    def __init__(self, parent: DynamicArray, start: int, size: int) -> None:
+        self._parent = parent
+        self._start = start
+        self._size = size
+        self._generation = parent._generation
+
+    def _storage(self):
+        """Return the parent's backing store, or raise if the view went stale"""
+        if self._generation != self._parent._generation:
+            raise DynamicArrayException("View is stale: the parent array was resized or shifted")
+        return self._parent._data
+
+    def __str__(self) -> str:
+        data = self._storage()
+        out = "DYN_ARR_VIEW Start/Size: " + str(self._start) + "/" + str(self._size) + ' ['
+        out += ', '.join([str(data[self._start + _]) for _ in range(self._size)])
+        return out + ']'
+
+    def __iter__(self):
+        for index in range(self._start, self._start + self._size):
+            yield self._storage()[index]
+
+    def get_at_index(self, index: int) -> object:
+        """Return value at the given position of the view. Invalid index raises DynamicArrayException"""
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+        return self._storage()[self._start + index]
+
+    def set_at_index(self, index: int, value: object) -> None:
+        """Store value at the given position of the view (and so in the parent array)"""
+        if index < 0 or index >= self._size:
+            raise DynamicArrayException
+        self._storage()[self._start + index] = value
+
+    def __getitem__(self, index) -> object:
+        return self.get_at_index(index)
+
+    def __setitem__(self, index, value) -> None:
+        self.set_at_index(index, value)
+
+    def is_empty(self) -> bool:
+        return self._size == 0
+
+    def length(self) -> int:
+        return self._size
+
+    def buffer(self) -> memoryview:
+        """Return a writable memoryview over the window of a typed parent array"""
+        self._storage()
+        return self._parent.buffer()[self._start:self._start + self._size]
+
+    def view(self, start_index: int, size: int) -> 'DynamicArrayView':
+        """Return a narrower window, with the same rules as DynamicArray.view()"""
+        self._storage()
+        if start_index < 0 or start_index >= self._size or size < 0:
+            raise DynamicArrayException("Invalid start index or size")
+        if start_index + size > self._size:
+            raise DynamicArrayException("Not enough elements to create the view")
+        return DynamicArrayView(self._parent, self._start + start_index, size)
+
+    def copy(self) -> DynamicArray:
+        """Materialize the window as a new, independent DynamicArray"""
+        self._storage()
+        if self._size == 0:
+            return DynamicArray(typecode=self._parent._typecode, policy=self._parent._policy)
+        return self._parent.slice(self._start, self._size)
+
+    def map(self, map_func, typecode: str = None) -> DynamicArray:
+        """Return a new DynamicArray with map_func applied to each element of the view, see DynamicArray.map()"""
+        mapped_array = DynamicArray(typecode=typecode, policy=self._parent._policy)
+        for value in self:
+            value = map_func(value)
+            try:
+                mapped_array.append(value)
+            except (TypeError, OverflowError):
+                mapped_array._drop_typecode()
+                mapped_array.append(value)
+        return mapped_array
+
+    def filter(self, filter_func) -> DynamicArray:
+        """Return a new DynamicArray with the elements of the view for which filter_func is true"""
+        filtered_array = DynamicArray(typecode=self._parent._typecode, policy=self._parent._policy)
+        for value in self:
+            if filter_func(value):
+                filtered_array.append(value)
+        return filtered_array
+
+    def reduce(self, reduce_func, initializer=None):
+        """Fold the elements of the view with reduce_func, like DynamicArray.reduce()"""
+        if self._size == 0:
+            return initializer
+        values = iter(self)
+        accumulator = next(values) if initializer is None else initializer
+        for value in values:
+            accumulator = reduce_func(accumulator, value)
+        return accumulator
+
+    def lazy(self) -> 'LazyPipeline':
+        """Start a lazy map/filter/reduce pipeline over the view, see DynamicArray.lazy()"""
+        return LazyPipeline(self)
+
+class LazyPipeline:
+    """
+    Deferred chain of map / filter / take stages over a DynamicArray (or any iterable).
+    Adding a stage returns a new pipeline and does no work. Terminal operations
+    (collect, reduce, any, first, iteration) push each source element through all
+    stages in one loop, and stop reading the source as soon as the answer is known.
+    """
+    _MAP, _FILTER, _TAKE = 0, 1, 2
+
+    def __init__(self, source, stages: tuple = ()) -> None:
+        self._source = source
+        self._stages = stages
+
+    def map(self, map_func) -> 'LazyPipeline':
+        """Add a stage that replaces each value with map_func(value)"""
+        return LazyPipeline(self._source, self._stages + ((self._MAP, map_func),))
+
+    def filter(self, filter_func) -> 'LazyPipeline':
+        """Add a stage that drops values for which filter_func(value) is false"""
+        return LazyPipeline(self._source, self._stages + ((self._FILTER, filter_func),))
+
+    def take(self, count: int) -> 'LazyPipeline':
+        """Add a stage that passes on at most count values and then ends the pipeline"""
+        return LazyPipeline(self._source, self._stages + ((self._TAKE, count),))
+
+    def __iter__(self):
+        # take stages count down in a per-run copy so the pipeline can be reused
+        stages = [[kind, arg] for kind, arg in self._stages]
+        if any(kind == self._TAKE and arg <= 0 for kind, arg in stages):
+            return
+        map_kind, filter_kind = self._MAP, self._FILTER
+        for value in self._source:
+            exhausted = False
+            for stage in stages:
+                kind = stage[0]
+                if kind == map_kind:
+                    value = stage[1](value)
+                elif kind == filter_kind:
+                    if not stage[1](value):
+                        break
+                else:
+                    stage[1] -= 1
+                    if stage[1] == 0:
+                        exhausted = True
+            else:
+                yield value
+            if exhausted:
+                return
+
+    def collect(self, typecode: str = None) -> DynamicArray:
+        """Run the pipeline and return its values as a new DynamicArray"""
+        return DynamicArray(self, typecode=typecode)
+
+    def reduce(self, reduce_func, initializer=None):
+        """Run the pipeline and fold its values with reduce_func, like DynamicArray.reduce()"""
+        values = iter(self)
+        if initializer is None:
+            accumulator = next(values, None)
+        else:
+            accumulator = initializer
+        for value in values:
+            accumulator = reduce_func(accumulator, value)
+        return accumulator
+
+    def any(self, predicate=None) -> bool:
+        """Return True as soon as a value (or predicate(value)) is true"""
+        for value in self:
+            if (predicate(value) if predicate is not None else value):
+                return True
+        return False
+
+    def first(self, default=None) -> object:
+        """Return the first value the pipeline produces, or default if there is none"""
+        return next(iter(self), default)
+
 def find_mode(arr: DynamicArray) -> (DynamicArray, int): #passes the prescribed test
     """
         Find the mode(s) and frequency of occurrence in a DynamicArray.
 
         Calculates the mode(s) and their frequency of occurrence in the provided 'arr' DynamicArray.
         The mode is the element(s) that appear most frequently in the array. If there are multiple modes,
-        all of them are returned. The frequency represents how many times the mode(s) appear in the array.
+        all of them are returned in order of first appearance. The frequency represents how many times the
+        mode(s) appear in the array.
+
+        Elements are counted in a hash table (or with NumPy for numeric arrays), so the input does
+        not need to be sorted and the run time is O(n). Arrays of unhashable elements fall back to the adjacent-run scan,
+        which is only correct for sorted input.
 
         Args:
         - arr (DynamicArray): The DynamicArray to find the mode(s) in.
@@ -338,6 +1531,23 @@ def find_mode(arr: DynamicArray) -> (DynamicArray, int): #passes the prescribed
     if arr.is_empty():
         return DynamicArray(), 0
 
+    values = numpy_backend.numeric_values(arr)
+    if values is not None:
+        result = numpy_backend.vector_mode(values)
+        if result is not None:
+            return DynamicArray(result[0]), result[1]
+
+    try:
+        counts = Counter(arr)
+    except TypeError:
+        return _find_mode_sorted(arr)
+
+    max_frequency = max(counts.values())
+    mode_elements = DynamicArray([value for value, count in counts.items() if count == max_frequency])
+    return mode_elements, max_frequency
+
+def _find_mode_sorted(arr: DynamicArray) -> (DynamicArray, int):
+    """find_mode() for sorted input by counting runs of adjacent equal elements"""
     max_frequency = 1
     current_frequency = 1
     mode_elements = DynamicArray()
@@ -356,4 +1566,93 @@ def find_mode(arr: DynamicArray) -> (DynamicArray, int): #passes the prescribed
         elif current_frequency == max_frequency:
             mode_elements.append(arr[i])
 
-    return mode_elements, max_frequency
\ No newline at end of file
+    return mode_elements, max_frequency
+
+class ModeTracker:
+    """
+    Incrementally maintained mode(s) of a stream of hashable values.
+
+    Values are counted per value and also grouped into buckets by count, so adding or
+    removing a value, frequency() and mode() are all O(1), and modes() is O(number of
+    modes). remove() makes it usable for rolling windows: add the incoming event and
+    remove the one that falls out of the window.
+    """
+    def __init__(self, values=None) -> None:
+        self._counts = {}       # value -> count
+        self._buckets = {}      # count -> {value: None}, an insertion-ordered set
+        self._max_frequency = 0
+        self._total = 0
+        if values is not None:
+            self.add_many(values)
+
+    def _move(self, value, old_count: int, new_count: int) -> None:
+        """Move value from the old_count bucket to the new_count bucket"""
+        if old_count:
+            bucket = self._buckets[old_count]
+            del bucket[value]
+            if not bucket:
+                del self._buckets[old_count]
+                if old_count == self._max_frequency and new_count < old_count:
+                    # value was the last one at the top count and now sits one below it
+                    self._max_frequency = new_count
+        if new_count:
+            self._counts[value] = new_count
+            self._buckets.setdefault(new_count, {})[value] = None
+            if new_count > self._max_frequency:
+                self._max_frequency = new_count
+        else:
+            del self._counts[value]
+
+    def add(self, value) -> None:
+        """Record one occurrence of value"""
+        count = self._counts.get(value, 0)
+        self._move(value, count, count + 1)
+        self._total += 1
+
+    def add_many(self, values) -> None:
+        """
+        Record every value of an iterable, e.g. a DynamicArray, in order.
+
+        Equivalent to calling add() for each value, so mode() and modes() report the
+        values in the order they reached the top frequency within the batch too.
+        """
+        add = self.add
+        for value in values:
+            add(value)
+
+    def remove(self, value) -> None:
+        """
+        Forget one occurrence of value.
+
+        Raises:
+        DynamicArrayException: If value is not currently tracked.
+        """
+        count = self._counts.get(value, 0)
+        if not count:
+            raise DynamicArrayException("Value is not tracked")
+        self._move(value, count, count - 1)
+        self._total -= 1
+
+    def count(self, value) -> int:
+        """Return how many times value is currently recorded"""
+        return self._counts.get(value, 0)
+
+    def frequency(self) -> int:
+        """Return the frequency of the current mode(s), 0 when nothing is tracked"""
+        return self._max_frequency
+
+    def mode(self) -> object:
+        """Return one current mode (the first to reach the top frequency), or None when empty"""
+        if not self._max_frequency:
+            return None
+        return next(iter(self._buckets[self._max_frequency]))
+
+    def modes(self) -> DynamicArray:
+        """Return all current modes, in the order they reached the top frequency"""
+        if not self._max_frequency:
+            return DynamicArray()
+        return DynamicArray(list(self._buckets[self._max_frequency]))
+
+    def length(self) -> int:
+        """Return the total number of values currently recorded"""
+        return self._total
@@ -0,0 +1,168 @@
+"""
+Optional NumPy backend for numeric DynamicArrays.
+
+When NumPy is importable and an array holds only numbers (a typed array, or an
+object array whose elements are all int or all float), DynamicArray.map, filter
+and reduce, find_mode and heapsort hand the work to vectorized NumPy kernels.
+Everything here returns None (or False) when it cannot guarantee the same
+result as the pure-Python path, and the caller then takes that path instead.
+
+map / filter / reduce only vectorize callables that accept whole arrays: NumPy
+ufuncs, or functions marked with the vectorized() decorator.
+"""
+from array import array
+
+try:
+    import numpy
+except ImportError:  # NumPy is optional, every entry point degrades to "not handled"
+    numpy = None
+
+# Below this many elements converting to NumPy costs more than it saves
+MIN_SIZE = 32
+
+if numpy is not None:
+    # ufuncs whose reduction does not depend on evaluation order
+    _ORDER_FREE = {numpy.minimum, numpy.maximum, numpy.fmin, numpy.fmax, numpy.bitwise_and,
+                   numpy.bitwise_or, numpy.bitwise_xor, numpy.logical_and, numpy.logical_or}
+    # ufuncs reduced with accumulate(), which folds strictly left to right like the serial loop
+    _SEQUENTIAL_FLOAT = {numpy.add, numpy.subtract, numpy.multiply, numpy.true_divide}
+    _SEQUENTIAL_INT = {numpy.add, numpy.subtract}
+
+
+def available() -> bool:
+    """Return True if NumPy could be imported"""
+    return numpy is not None
+
+
+def vectorized(func):
+    """Mark func as taking and returning whole NumPy arrays, so map/filter may call it once"""
+    func.__vectorized__ = True
+    return func
+
+
+def accepts(func) -> bool:
+    """Return True if func is a ufunc or vectorized() callable and NumPy is available"""
+    return numpy is not None and (isinstance(func, numpy.ufunc) or getattr(func, '__vectorized__', False))
+
+
+def numeric_values(da, widen: bool = False):
+    """
+    Return the elements of a DynamicArray as a 1-D ndarray, or None.
+
+    Typed arrays are wrapped without copying, unless the elements of a
+    CircularDynamicArray wrap around its ring. Object arrays are converted only if
+    every element is an int (fitting in int64) or every element is a float.
+    With widen=True narrow typed buffers are copied to int64 / float64, the types
+    a ufunc applied to one Python int or float at a time would compute in.
+    """
+    if numpy is None or da.length() < MIN_SIZE:
+        return None
+    typecode = da.get_typecode()
+    if typecode is not None:
+        if typecode in 'uw':
+            return None
+        if da._contiguous():
+            values = numpy.asarray(da.buffer())
+        else:
+            # a wrapped CircularDynamicArray: copy the elements out in order
+            values = numpy.asarray(da._data.read_block(0, da.length()))
+        if not widen or values.dtype in (numpy.int64, numpy.float64):
+            return values
+        if values.dtype.kind == 'f':
+            return values.astype(numpy.float64)
+        if values.dtype.kind == 'u' and values.size and int(values.max()) > numpy.iinfo(numpy.int64).max:
+            return None
+        return values.astype(numpy.int64)
+
+    block = da._data.read_block(0, da.length())
+    kinds = set(map(type, block))
+    if kinds == {float}:
+        return numpy.array(block, dtype=numpy.float64)
+    if kinds == {int}:
+        try:
+            return numpy.array(block, dtype=numpy.int64)
+        except OverflowError:
+            return None
+    return None
+
+
+def result_typecode(result, typecode: str):
+    """Return typecode if serial map(typecode=...) would keep it for these mapped values, or None for object storage"""
+    if typecode is None or typecode in 'uw':
+        return None
+    kind = result.dtype.kind
+    if typecode in 'fd':
+        return typecode if kind in 'biuf' else None
+    if kind not in 'iu':
+        return None
+    if result.size == 0:
+        return typecode
+    bits = 8 * array(typecode).itemsize
+    low, high = (-(1 << (bits - 1)), (1 << (bits - 1)) - 1) if typecode.islower() else (0, (1 << bits) - 1)
+    return typecode if low <= int(result.min()) and int(result.max()) <= high else None
+
+
+def to_block(result, typecode: str):
+    """Convert an ndarray to a block for DynamicArray.extend(): an array.array if typed, else a list"""
+    if typecode is None:
+        return result.tolist()
+    block = array(typecode)
+    block.frombytes(numpy.ascontiguousarray(result, dtype=numpy.dtype(typecode)).tobytes())
+    return block
+
+
+def select(values, mask):
+    """Return the values whose entry in a boolean mask (any sequence of truth values) is true"""
+    return values[numpy.asarray(mask, dtype=bool)]
+
+
+def vector_reduce(func, values, initializer=None):
+    """
+    Reduce values with a binary ufunc, or return None if the result could differ
+    from folding element by element (non-ufunc, unknown ufunc, possible overflow).
+    """
+    if not isinstance(func, numpy.ufunc) or func.nin != 2 or func.nout != 1:
+        return None
+    if initializer is not None:
+        if not isinstance(initializer, (int, float)) or isinstance(initializer, bool):
+            return None
+        try:
+            values = numpy.concatenate((numpy.asarray([initializer]), values))
+        except OverflowError:
+            return None
+
+    if func in _ORDER_FREE:
+        return func.reduce(values).item()
+    kind = values.dtype.kind
+    if kind == 'f' and func in _SEQUENTIAL_FLOAT:
+        # the serial loop sees Python floats, so accumulate in double precision
+        return func.accumulate(values.astype(numpy.float64))[-1].item()
+    if kind in 'iu' and func in _SEQUENTIAL_INT:
+        # integer add/subtract are exact unless the running total can leave int64
+        bound = int(numpy.abs(values.astype(numpy.float64)).max()) * len(values)
+        if bound < (1 << 62):
+            return func.reduce(values.astype(numpy.int64)).item()
+    return None
+
+
+def vector_mode(values):
+    """Return (modes in order of first appearance, frequency) for numeric values, or None if NaNs are present"""
+    if values.dtype.kind == 'f' and numpy.isnan(values).any():
+        return None
+    unique, first_index, counts = numpy.unique(values, return_index=True, return_counts=True)
+    frequency = int(counts.max())
+    first_index = numpy.sort(first_index[counts == frequency])
+    return values[first_index].tolist(), frequency
+
+
+def sort_descending(da) -> bool:
+    """Sort a numeric DynamicArray in non-ascending order in place; False if it is not handled"""
+    values = numeric_values(da)
+    if values is None or (values.dtype.kind == 'f' and numpy.isnan(values).any()):
+        return False
+    ordered = numpy.sort(values)[::-1]
+    if da.get_typecode() is not None and da._contiguous():
+        values[:] = ordered             # values shares the typed buffer
+    else:
+        da._data.write_block(0, to_block(ordered, da.get_typecode()))
+    return True
@@ -0,0 +1,132 @@
+"""
+Parallel map / filter / reduce over a DynamicArray.
+
+The array is cut into contiguous chunks, each chunk is handed to a
+concurrent.futures thread or process pool, and the per-chunk results are
+stitched back together. With ordered=True (the default) the results match the
+serial DynamicArray.map / filter / reduce exactly.
+
+Process pools pickle the callback and every chunk, so the callback must be a
+module-level function; thread pools only help callbacks that release the GIL.
+"""
+import os
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+
+from dynamic_array import DynamicArray, DynamicArrayException
+
+
+def _map_chunk(map_func, block) -> list:
+    return [map_func(value) for value in block]
+
+
+def _filter_chunk(filter_func, block) -> list:
+    return [value for value in block if filter_func(value)]
+
+
+def _reduce_chunk(reduce_func, block) -> object:
+    accumulator = block[0]
+    for index in range(1, len(block)):
+        accumulator = reduce_func(accumulator, block[index])
+    return accumulator
+
+
+def _run_chunks(arr: DynamicArray, chunk_func, func, workers, chunksize, ordered, executor) -> list:
+    """
+    Apply chunk_func(func, block) to consecutive blocks of arr on a pool.
+
+    Returns:
+    list: The per-chunk results, in array order if ordered is True, otherwise in
+    the order the chunks finished.
+    """
+    size = arr.length()
+    if size == 0:
+        return []
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers < 1:
+        raise DynamicArrayException("workers must be at least 1")
+    if chunksize is None:
+        # a few chunks per worker smooths out uneven callback costs
+        chunksize = -(-size // (workers * 4))
+    if chunksize < 1:
+        raise DynamicArrayException("chunksize must be at least 1")
+
+    blocks = [arr._data.read_block(start, min(chunksize, size - start)) for start in range(0, size, chunksize)]
+
+    if isinstance(executor, Executor):
+        pool, owned = executor, False
+    elif executor == 'thread':
+        pool, owned = ThreadPoolExecutor(max_workers=workers), True
+    elif executor == 'process':
+        pool, owned = ProcessPoolExecutor(max_workers=workers), True
+    else:
+        raise DynamicArrayException("executor must be 'thread', 'process' or an Executor")
+
+    try:
+        futures = [pool.submit(chunk_func, func, block) for block in blocks]
+        if ordered:
+            return [future.result() for future in futures]
+        return [future.result() for future in as_completed(futures)]
+    finally:
+        if owned:
+            pool.shutdown()
+
+
+def parallel_map(arr: DynamicArray, map_func, workers: int = None, chunksize: int = None,
+                 ordered: bool = True, executor='thread', typecode: str = None) -> DynamicArray:
+    """
+    Parallel counterpart of DynamicArray.map().
+
+    Args:
+    - arr (DynamicArray): The array to map.
+    - map_func (function): Applied to every element.
+    - workers (int): Pool size, defaults to the number of CPUs.
+    - chunksize (int): Elements per task, defaults to about four tasks per worker.
+    - ordered (bool): Keep array order; with False chunks are concatenated as they finish.
+    - executor: 'thread', 'process' or an existing concurrent.futures Executor.
+    - typecode (str): Optional typecode for the result, as for DynamicArray.map().
+
+    Returns:
+    DynamicArray: The mapped values, in object storage unless typecode is given.
+    """
+    mapped_array = DynamicArray(typecode=typecode, policy=arr.get_policy())
+    for values in _run_chunks(arr, _map_chunk, map_func, workers, chunksize, ordered, executor):
+        try:
+            mapped_array.extend(values)
+        except (TypeError, OverflowError):
+            mapped_array._drop_typecode()
+            mapped_array.extend(values)
+    return mapped_array
+
+
+def parallel_filter(arr: DynamicArray, filter_func, workers: int = None, chunksize: int = None,
+                    ordered: bool = True, executor='thread') -> DynamicArray:
+    """
+    Parallel counterpart of DynamicArray.filter(). Arguments as for parallel_map().
+
+    Returns:
+    DynamicArray: The elements for which filter_func returned True.
+    """
+    filtered_array = DynamicArray(typecode=arr.get_typecode(), policy=arr.get_policy())
+    for values in _run_chunks(arr, _filter_chunk, filter_func, workers, chunksize, ordered, executor):
+        filtered_array.extend(values)
+    return filtered_array
+
+
+def parallel_reduce(arr: DynamicArray, reduce_func, initializer=None, workers: int = None,
+                    chunksize: int = None, ordered: bool = True, executor='thread') -> object:
+    """
+    Parallel counterpart of DynamicArray.reduce().
+
+    Every chunk is folded on its own and the partial results are then folded in
+    order, starting from initializer when one is given. This equals the serial
+    result whenever reduce_func is associative; with ordered=False it must also
+    be commutative. Other arguments as for parallel_map().
+
+    Returns:
+    object: The folded value, or initializer for an empty array.
+    """
+    partials = _run_chunks(arr, _reduce_chunk, reduce_func, workers, chunksize, ordered, executor)
+    if not partials:
+        return initializer
+    return DynamicArray(partials).reduce(reduce_func, initializer)
@@ -0,0 +1,180 @@
+"""
+Priority queues built on MinHeap for producer / consumer use.
+
+ConcurrentPriorityQueue is shared between threads: put() and get() take one
+lock, get() blocks on a condition variable instead of polling is_empty(), and
+put_many() / get_many() move a whole batch under a single lock acquisition.
+
+AsyncPriorityQueue is the asyncio counterpart for coroutines running on one
+event loop: get() is awaitable and suspends until an item is available.
+
+Extra keyword arguments (arity, key, reverse, stable) are passed to MinHeap.
+"""
+import asyncio
+import threading
+from collections import deque
+from queue import Empty
+
+from dynamic_array import DynamicArray
+from min_heap import MinHeap
+
+
+class ConcurrentPriorityQueue:
+    """Thread-safe, unbounded priority queue; get() returns the minimum first"""
+    def __init__(self, start_heap=None, **heap_options) -> None:
+        self._options = heap_options
+        self._heap = MinHeap(start_heap, **heap_options)
+        self._lock = threading.Lock()
+        self._not_empty = threading.Condition(self._lock)
+
+    def put(self, node: object) -> None:
+        """Add node and wake one waiting consumer"""
+        with self._lock:
+            self._heap.add(node)
+            self._not_empty.notify()
+
+    def put_many(self, nodes) -> None:
+        """
+        Add every node of an iterable under one lock acquisition.
+
+        The batch is heapified on its own outside the lock and then melded in, so
+        the lock is held for O(n + k) at most rather than k separate sifts. On a
+        stable queue, equal keys come out in the order of nodes, after those already queued.
+        """
+        batch = MinHeap(nodes, **self._options)
+        if batch.is_empty():
+            return
+        with self._lock:
+            self._heap.meld(batch)
+            self._not_empty.notify(batch.size())
+
+    def get(self, block: bool = True, timeout: float = None) -> object:
+        """
+        Remove and return the minimum.
+
+        If block is True, wait until an item is available, for at most timeout
+        seconds when timeout is given.
+
+        Raises:
+        queue.Empty: If no item became available.
+        """
+        with self._lock:
+            self._wait(block, timeout)
+            return self._heap.remove_min()
+
+    def get_nowait(self) -> object:
+        """Same as get(block=False)"""
+        return self.get(block=False)
+
+    def get_many(self, max_items: int, block: bool = True, timeout: float = None) -> DynamicArray:
+        """
+        Remove up to max_items of the smallest items under one lock acquisition.
+
+        Waits like get() for the first item, then returns whatever is available
+        up to max_items, in ascending order.
+
+        Raises:
+        queue.Empty: If no item became available.
+        """
+        with self._lock:
+            self._wait(block, timeout)
+            return self._heap.pop_n(max_items)
+
+    def _wait(self, block: bool, timeout: float) -> None:
+        """Wait (with the lock held) until the heap is not empty, or raise queue.Empty"""
+        if not block:
+            if self._heap.is_empty():
+                raise Empty
+        elif not self._not_empty.wait_for(lambda: not self._heap.is_empty(), timeout):
+            raise Empty
+
+    def qsize(self) -> int:
+        """Return the approximate number of queued items"""
+        with self._lock:
+            return self._heap.size()
+
+    def empty(self) -> bool:
+        """Return True if the queue is (momentarily) empty"""
+        with self._lock:
+            return self._heap.is_empty()
+
+
+class AsyncPriorityQueue:
+    """
+    Unbounded priority queue for coroutines on a single event loop (not thread-safe).
+    Use asyncio.wait_for(queue.get(), timeout) to bound the wait.
+    """
+    def __init__(self, start_heap=None, **heap_options) -> None:
+        self._options = heap_options
+        self._heap = MinHeap(start_heap, **heap_options)
+        self._getters = deque()
+
+    def _wakeup(self, count: int = 1) -> None:
+        """Resolve up to count pending get() futures"""
+        while count and self._getters:
+            getter = self._getters.popleft()
+            if not getter.done():
+                getter.set_result(None)
+                count -= 1
+
+    def put_nowait(self, node: object) -> None:
+        """Add node and wake one waiting consumer"""
+        self._heap.add(node)
+        self._wakeup()
+
+    async def put(self, node: object) -> None:
+        """Add node; never waits because the queue is unbounded"""
+        self.put_nowait(node)
+
+    def put_many(self, nodes) -> None:
+        """Add every node of an iterable with one bulk meld and wake that many consumers (stable order as put_many of ConcurrentPriorityQueue)"""
+        batch = MinHeap(nodes, **self._options)
+        self._heap.meld(batch)
+        self._wakeup(batch.size())
+
+    async def _wait(self) -> None:
+        """Suspend until the heap is not empty"""
+        while self._heap.is_empty():
+            getter = asyncio.get_running_loop().create_future()
+            self._getters.append(getter)
+            try:
+                await getter
+            except BaseException:
+                getter.cancel()
+                try:
+                    self._getters.remove(getter)
+                except ValueError:
+                    pass
+                # pass a wake-up we may have consumed on to the next consumer
+                if not self._heap.is_empty() and not getter.cancelled():
+                    self._wakeup()
+                raise
+
+    async def get(self) -> object:
+        """Remove and return the minimum, waiting until an item is available"""
+        await self._wait()
+        return self._heap.remove_min()
+
+    def get_nowait(self) -> object:
+        """
+        Remove and return the minimum without waiting.
+
+        Raises:
+        asyncio.QueueEmpty: If the queue is empty.
+        """
+        if self._heap.is_empty():
+            raise asyncio.QueueEmpty
+        return self._heap.remove_min()
+
+    async def get_many(self, max_items: int) -> DynamicArray:
+        """Wait for the first item, then remove up to max_items of the smallest in ascending order"""
+        await self._wait()
+        return self._heap.pop_n(max_items)
+
+    def qsize(self) -> int:
+        """Return the number of queued items"""
+        return self._heap.size()
+
+    def empty(self) -> bool:
+        """Return True if the queue is empty"""
+        return self._heap.is_empty()
@@ -0,0 +1,32 @@
+"""
+Tests for DynamicArray behaviour that the prescribed tests do not pin down.
+"""
+
+import unittest
+
+from dynamic_array import DynamicArray
+
+
+class SliceTest(unittest.TestCase):
+
+    def test_small_slice_does_not_resize(self):
+        for typecode in (None, 'q'):
+            source = DynamicArray(range(100), typecode=typecode)
+            part = source.slice(3, 2)
+            self.assertEqual(list(part), [3, 4])
+            self.assertEqual(part.resize_stats()['resizes'], 0)
+
+    def test_slice_capacity_matches_append(self):
+        for size in (1, 4, 5, 50, 100):
+            source = DynamicArray(range(100))
+            appended = DynamicArray()
+            for value in range(size):
+                appended.append(value)
+            part = source.slice(0, size)
+            self.assertEqual(list(part), list(range(size)))
+            self.assertEqual(part.get_capacity(), appended.get_capacity())
+            self.assertLessEqual(part.resize_stats()['resizes'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
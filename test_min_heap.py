@@ -0,0 +1,274 @@
+"""
+Randomized tests for MinHeap against the standard library heapq module.
+
+Each operation is replayed on a MinHeap and on a plain list managed with heapq,
+for every arity from 2 to 8 and with many duplicate values. The popped objects
+must agree, validate() must pass after every step and, with stats enabled, the
+reported comparison count must equal the comparisons actually performed.
+
+TopK and RunningMedian, which are built on MinHeap, are checked against
+heapq.nlargest and the statistics module.
+"""
+
+import heapq
+import random
+import statistics
+import unittest
+
+from dynamic_array import DynamicArray
+from min_heap import MinHeap, MinHeapException, RunningMedian, TopK
+
+ARITIES = range(2, 9)
+ROUNDS = 400
+
+
+class _Counted:
+    """An orderable value that counts every comparison made on it"""
+    __slots__ = ('value',)
+    comparisons = 0
+
+    def __init__(self, value) -> None:
+        self.value = value
+
+    def __lt__(self, other: '_Counted') -> bool:
+        _Counted.comparisons += 1
+        return self.value < other.value
+
+    def __le__(self, other: '_Counted') -> bool:
+        _Counted.comparisons += 1
+        return self.value <= other.value
+
+    def __gt__(self, other: '_Counted') -> bool:
+        _Counted.comparisons += 1
+        return self.value > other.value
+
+    def __ge__(self, other: '_Counted') -> bool:
+        _Counted.comparisons += 1
+        return self.value >= other.value
+
+    def __repr__(self) -> str:
+        return f"_Counted({self.value!r})"
+
+
+def _values(objects) -> list:
+    """Unwrap a sequence of _Counted objects"""
+    return [obj.value for obj in objects]
+
+
+class MinHeapAgainstHeapqTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(2024)
+
+    def value(self):
+        # a narrow range so that most values occur several times
+        return self.rng.randint(0, 15)
+
+    def assertSameHeap(self, heap, reference, msg):
+        self.assertTrue(heap.validate(), msg)
+        self.assertEqual(heap.size(), len(reference), msg)
+        if reference:
+            self.assertEqual(heap.get_min().value, reference[0].value, msg)
+        else:
+            self.assertTrue(heap.is_empty(), msg)
+
+    def assertCounted(self, heap, before, msg):
+        """The stats must report exactly the comparisons made since before; call before touching heapq"""
+        counted = _Counted.comparisons - before[0]
+        reported = heap.stats().get('comparisons', 0) - before[1]
+        self.assertEqual(reported, counted, msg)
+
+    def test_operations(self):
+        for arity in ARITIES:
+            heap = MinHeap(arity=arity)
+            heap.enable_stats()
+            reference = []
+            for step in range(ROUNDS):
+                msg = f"arity={arity} step={step}"
+                operation = self.rng.choice(('add', 'add', 'add', 'add', 'remove_min', 'pushpop', 'replace', 'pop_n'))
+                node = _Counted(self.value())
+                before = (_Counted.comparisons, heap.stats().get('comparisons', 0))
+
+                if operation == 'add':
+                    heap.add(node)
+                    self.assertCounted(heap, before, msg)
+                    heapq.heappush(reference, node)
+                elif operation == 'remove_min':
+                    if not reference:
+                        continue
+                    popped = heap.remove_min()
+                    self.assertCounted(heap, before, msg)
+                    self.assertEqual(popped.value, heapq.heappop(reference).value, msg)
+                elif operation == 'pushpop':
+                    popped = heap.pushpop(node)
+                    self.assertCounted(heap, before, msg)
+                    self.assertEqual(popped.value, heapq.heappushpop(reference, node).value, msg)
+                elif operation == 'replace':
+                    if not reference:
+                        continue
+                    popped = heap.replace(node)
+                    self.assertCounted(heap, before, msg)
+                    self.assertEqual(popped.value, heapq.heapreplace(reference, node).value, msg)
+                else:
+                    count = self.rng.randint(0, 5)
+                    expected = [heapq.heappop(reference).value for _ in range(min(count, len(reference)))]
+                    self.assertEqual(_values(heap.pop_n(count)), expected, msg)
+
+                self.assertSameHeap(heap, reference, msg)
+
+            self.assertEqual(_values(heap.drain()), sorted(_values(reference)))
+
+    def test_build_heap(self):
+        for arity in ARITIES:
+            for size in (0, 1, 2, arity, arity + 1, 50, 257):
+                values = [self.value() for _ in range(size)]
+                msg = f"arity={arity} size={size}"
+                heap = MinHeap(arity=arity)
+                heap.build_heap(DynamicArray(values))
+                self.assertTrue(heap.validate(), msg)
+                self.assertEqual(list(heap.pop_n(size)), sorted(values), msg)
+
+                heap = MinHeap(values, arity=arity)
+                self.assertTrue(heap.validate(), msg)
+                self.assertEqual(list(heap.drain()), sorted(values), msg)
+
+    def test_pop_n_bounds(self):
+        for arity in ARITIES:
+            values = [self.value() for _ in range(30)]
+            heap = MinHeap(values, arity=arity)
+            reference = list(values)
+            heapq.heapify(reference)
+            self.assertEqual(heap.pop_n(0).length(), 0)
+            expected = [heapq.heappop(reference) for _ in range(7)]
+            self.assertEqual(list(heap.pop_n(7)), expected)
+            self.assertTrue(heap.validate())
+            self.assertEqual(list(heap.pop_n(100)), sorted(reference))
+            self.assertTrue(heap.is_empty())
+
+    def test_stable_and_reverse(self):
+        for arity in ARITIES:
+            pairs = [(self.value(), sequence) for sequence in range(200)]
+
+            stable = MinHeap(arity=arity, key=lambda pair: pair[0], stable=True)
+            reverse = MinHeap(arity=arity, reverse=True)
+            for pair in pairs:
+                stable.add(pair)
+                reverse.add(pair[0])
+            self.assertTrue(stable.validate())
+            self.assertTrue(reverse.validate())
+
+            # equal keys come out in insertion order, as heapq does for (key, sequence) tuples
+            reference = list(pairs)
+            heapq.heapify(reference)
+            self.assertEqual([stable.remove_min() for _ in pairs],
+                             [heapq.heappop(reference) for _ in pairs])
+            self.assertEqual([reverse.remove_min() for _ in pairs],
+                             sorted((key for key, _ in pairs), reverse=True))
+
+    def test_stable_meld(self):
+        first_key = lambda pair: pair[0]
+        for arity in ARITIES:
+            # small batches are added node by node, large ones appended and heapified
+            for size, other_size in ((500, 2), (500, 20), (30, 30), (10, 200)):
+                for shared_key in (True, False):
+                    msg = f"arity={arity} sizes={size},{other_size} shared_key={shared_key}"
+                    pairs = [(self.value(), 'self', index) for index in range(size)]
+                    other_pairs = [(self.value(), 'other', index) for index in range(other_size)]
+                    heap = MinHeap(pairs, arity=arity, key=first_key, stable=True)
+                    # two separately defined lambdas are never the same key function
+                    other_key = first_key if shared_key else (lambda pair: pair[0])
+                    other = MinHeap(arity=arity, key=other_key, stable=True)
+                    for pair in other_pairs:
+                        other.add(pair)
+
+                    heap.meld(other)
+                    self.assertTrue(heap.validate(), msg)
+                    self.assertEqual(list(heap.drain()), sorted(pairs + other_pairs, key=first_key), msg)
+                    self.assertEqual(other.size(), other_size, msg)
+
+
+class TopKTest(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(7)
+
+    def test_push_many_on_full_container(self):
+        top = TopK(3)
+        top.push_many([5, 6, 7])
+        top.push_many([1, 2, 3, 100, 200])
+        self.assertEqual(top.size(), 3)
+        self.assertEqual(list(top.items()), [200, 100, 7])
+
+    def test_against_nlargest(self):
+        for k in (1, 2, 5, 16):
+            for key in (None, lambda value: -value):
+                top = TopK(k, key=key)
+                seen = []
+                for _ in range(60):
+                    chunk = [self.rng.randint(0, 30) for _ in range(self.rng.randint(0, 8))]
+                    if self.rng.random() < 0.5:
+                        top.push_many(DynamicArray(chunk) if chunk and self.rng.random() < 0.5 else chunk)
+                    else:
+                        for value in chunk:
+                            top.push(value)
+                    seen.extend(chunk)
+                    msg = f"k={k} key={key} seen={len(seen)}"
+                    expected = heapq.nlargest(k, seen, key=key)
+                    self.assertEqual(top.size(), len(expected), msg)
+                    self.assertEqual(list(top.items()), expected, msg)
+                    if expected:
+                        self.assertEqual(top.get_min(), expected[-1], msg)
+
+    def test_push_returns_rejected_item(self):
+        top = TopK(2)
+        self.assertIsNone(top.push(4))
+        self.assertIsNone(top.push(8))
+        self.assertEqual(top.push(1), 1)
+        self.assertEqual(top.push(4), 4)  # equal to the weakest item: rejected
+        self.assertEqual(top.push(9), 4)
+        self.assertEqual(list(top.items()), [9, 8])
+
+    def test_invalid_k_and_empty(self):
+        with self.assertRaises(MinHeapException):
+            TopK(0)
+        top = TopK(3)
+        self.assertTrue(top.is_empty())
+        with self.assertRaises(MinHeapException):
+            top.get_min()
+        top.push_many([])
+        self.assertTrue(top.is_empty())
+        top.push_many([1, 2])
+        top.clear()
+        self.assertEqual(top.size(), 0)
+
+
+class RunningMedianTest(unittest.TestCase):
+
+    def test_against_statistics(self):
+        rng = random.Random(11)
+        for integers in (True, False):
+            running = RunningMedian()
+            seen = []
+            for _ in range(300):
+                value = rng.randint(0, 20) if integers else rng.uniform(-5, 5)
+                if rng.random() < 0.2:
+                    batch = [value, value + 1, value - 1]
+                    running.add_many(batch)
+                    seen.extend(batch)
+                else:
+                    running.add(value)
+                    seen.append(value)
+                self.assertEqual(running.size(), len(seen))
+                self.assertEqual(running.median_low(), statistics.median_low(seen))
+                self.assertEqual(running.median_high(), statistics.median_high(seen))
+                self.assertAlmostEqual(running.median(), statistics.median(seen))
+
+    def test_initial_values_and_empty(self):
+        with self.assertRaises(MinHeapException):
+            RunningMedian().median()
+        running = RunningMedian(DynamicArray([3, 1, 2, 4]))
+        self.assertEqual((running.median_low(), running.median_high(), running.median()), (2, 3, 2.5))
+
+
+if __name__ == '__main__':
+    unittest.main()
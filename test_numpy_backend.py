@@ -0,0 +1,210 @@
+"""
+Parity tests for the optional NumPy backend.
+
+Every operation that can take a vectorized path (map, filter, reduce, find_mode
+and heapsort) is run twice on the same input: once with NumPy available and
+once with numpy_backend.numpy patched to None, which forces the pure-Python
+loop. Both runs must produce the same values and the same typecode.
+"""
+
+import math
+import random
+import unittest
+from unittest import mock
+
+import numpy_backend
+from dynamic_array import DynamicArray, find_mode
+from min_heap import heapsort
+
+np = numpy_backend.numpy
+
+INT64_MAX = 2 ** 63 - 1
+
+# Sizes straddle numpy_backend.MIN_SIZE so that both the short-array fallback
+# and the vectorized path are exercised with NumPy present.
+SIZES = (0, 1, 5, numpy_backend.MIN_SIZE, 200)
+
+INT_TYPECODES = ('b', 'B', 'h', 'H', 'i', 'I', 'l', 'q', 'Q')
+FLOAT_TYPECODES = ('f', 'd')
+
+
+def _elements(da):
+    """Return the elements of a DynamicArray as a list"""
+    return [da[i] for i in range(da.length())]
+
+
+def _outcome(operation):
+    """Return the result of operation, or the type of the exception it raised"""
+    try:
+        return operation()
+    except Exception as exc:  # both paths must fail the same way
+        return type(exc)
+
+
+def _same(a, b) -> bool:
+    """Compare two scalars, treating NaN as equal to NaN"""
+    if isinstance(a, float) and isinstance(b, float) and math.isnan(a) and math.isnan(b):
+        return True
+    return bool(a == b)
+
+
+def _int_range(typecode):
+    """Return the (low, high) bounds used to draw values for an integer typecode"""
+    if typecode in ('b', 'B'):
+        return (0, 100) if typecode == 'B' else (-100, 100)
+    if typecode in ('H', 'I', 'Q'):
+        return 0, 1000
+    return -1000, 1000
+
+
+def _dataset(typecode, size, rng):
+    """Build a list of values that fits the given typecode"""
+    if typecode in FLOAT_TYPECODES:
+        # Few distinct values so that find_mode has real ties to break.
+        return [rng.choice((-2.5, -1.0, 0.0, 0.5, 3.0, rng.uniform(-10, 10))) for _ in range(size)]
+    low, high = _int_range(typecode)
+    return [rng.randint(low, high) // 10 for _ in range(size)]
+
+
+@unittest.skipUnless(numpy_backend.available(), "NumPy is not installed")
+class NumpyParityTest(unittest.TestCase):
+    """Vectorized results must match the pure-Python results exactly"""
+
+    def setUp(self):
+        self.rng = random.Random(1234)
+        self.errstate = np.errstate(all='ignore')
+        self.errstate.__enter__()
+
+    def tearDown(self):
+        self.errstate.__exit__(None, None, None)
+
+    def both(self, operation):
+        """Run operation with NumPy present and patched out and return both results"""
+        vectorized = _outcome(operation)
+        with mock.patch.object(numpy_backend, 'numpy', None):
+            serial = _outcome(operation)
+        return vectorized, serial
+
+    def assertSameArray(self, vectorized, serial, msg=None):
+        if isinstance(vectorized, type) or isinstance(serial, type):
+            self.assertEqual(vectorized, serial, msg)
+            return
+        self.assertEqual(vectorized.get_typecode(), serial.get_typecode(), msg)
+        left, right = _elements(vectorized), _elements(serial)
+        self.assertEqual(len(left), len(right), msg)
+        for a, b in zip(left, right):
+            self.assertTrue(_same(a, b), f"{msg}: {a!r} != {b!r}")
+
+    def assertSameScalar(self, vectorized, serial, msg=None):
+        self.assertTrue(_same(vectorized, serial), f"{msg}: {vectorized!r} != {serial!r}")
+
+    def datasets(self):
+        """Yield (typecode, values) pairs covering object and typed storage"""
+        for size in SIZES:
+            for typecode in INT_TYPECODES + FLOAT_TYPECODES:
+                yield typecode, _dataset(typecode, size, self.rng)
+            yield None, _dataset('q', size, self.rng)
+            yield None, _dataset('d', size, self.rng)
+
+    def check_all(self, typecode, values):
+        """Run every vectorizable operation on one dataset and compare the paths"""
+        label = f"typecode={typecode!r} size={len(values)}"
+        da = DynamicArray(values, typecode=typecode)
+
+        for func in (np.negative, np.absolute, np.square, np.sqrt):
+            vectorized, serial = self.both(lambda: da.map(func))
+            self.assertSameArray(vectorized, serial, f"map {func.__name__} {label}")
+        for target in ('q', 'd'):
+            vectorized, serial = self.both(lambda: da.map(np.absolute, typecode=target))
+            self.assertSameArray(vectorized, serial, f"map typecode={target} {label}")
+
+        mask = [self.rng.random() < 0.5 for _ in values]
+        vectorized, serial = self.both(lambda: da.filter(mask))
+        self.assertSameArray(vectorized, serial, f"filter mask {label}")
+        positive = numpy_backend.vectorized(lambda v: v > 0)
+        vectorized, serial = self.both(lambda: da.filter(positive))
+        self.assertSameArray(vectorized, serial, f"filter predicate {label}")
+
+        for func in (np.add, np.subtract, np.multiply, np.maximum, np.minimum):
+            for initializer in (None, 3):
+                if not values and initializer is None:
+                    continue
+                vectorized, serial = self.both(lambda: da.reduce(func, initializer))
+                self.assertSameScalar(vectorized, serial, f"reduce {func.__name__} init={initializer} {label}")
+
+        (v_mode, v_count), (s_mode, s_count) = self.both(lambda: find_mode(da))
+        self.assertEqual(v_count, s_count, f"find_mode count {label}")
+        self.assertSameArray(v_mode, s_mode, f"find_mode {label}")
+
+        vectorized = DynamicArray(values, typecode=typecode)
+        serial = DynamicArray(values, typecode=typecode)
+        heapsort(vectorized)
+        with mock.patch.object(numpy_backend, 'numpy', None):
+            heapsort(serial)
+        self.assertSameArray(vectorized, serial, f"heapsort {label}")
+
+    def test_typecodes(self):
+        for typecode, values in self.datasets():
+            with self.subTest(typecode=typecode, size=len(values)):
+                self.check_all(typecode, values)
+
+    def test_nan_inputs(self):
+        nan = float('nan')
+        for typecode in FLOAT_TYPECODES + (None,):
+            for size in SIZES[1:]:
+                values = _dataset('d', size, self.rng)
+                for i in self.rng.sample(range(size), max(1, size // 4)):
+                    values[i] = nan
+                with self.subTest(typecode=typecode, size=size):
+                    self.check_all(typecode, values)
+
+    def test_int64_overflow(self):
+        big = INT64_MAX // 2 + 1
+        cases = [
+            ('q', [big] * 40),  # sums and products leave int64 part way through
+            ('q', [INT64_MAX, 1] * 20),
+            ('q', [-INT64_MAX - 1, -1] * 20),  # negating and abs of the minimum
+            ('Q', [2 ** 64 - 1, 1] * 20),  # values that do not fit a signed int64
+            (None, [2 ** 70, -3] * 20),  # Python ints wider than any NumPy dtype
+            (None, [big, big, 1] * 15),
+        ]
+        for typecode, values in cases:
+            with self.subTest(typecode=typecode, first=values[0]):
+                self.check_all(typecode, values)
+
+    def test_patched_backend_is_unavailable(self):
+        with mock.patch.object(numpy_backend, 'numpy', None):
+            self.assertFalse(numpy_backend.available())
+            self.assertFalse(numpy_backend.accepts(np.add))
+            self.assertIsNone(numpy_backend.numeric_values(DynamicArray(list(range(100)), typecode='q')))
+
+
+@unittest.skipUnless(numpy_backend.available(), "NumPy is not installed")
+class ArrayProtocolTest(unittest.TestCase):
+    """DynamicArray.__array__ must work for every storage mode and honor copy="""
+
+    def test_object_storage(self):
+        da = DynamicArray([1, 2, 3])
+        self.assertEqual(np.asarray(da).tolist(), [1, 2, 3])
+        self.assertEqual(np.array(da).tolist(), [1, 2, 3])
+        self.assertEqual(np.asarray(da, dtype=float).dtype, np.float64)
+        with self.assertRaises(ValueError):
+            np.array(da, copy=False)
+
+    def test_typed_storage_shares_memory(self):
+        da = DynamicArray([1, 2, 3], typecode='q')
+        np.asarray(da)[0] = 9
+        np.array(da, copy=False)[1] = 8
+        self.assertEqual(list(da), [9, 8, 3])
+
+    def test_copy_and_dtype_do_not_alias(self):
+        da = DynamicArray([1, 2, 3], typecode='q')
+        np.array(da, copy=True)[0] = 9
+        np.asarray(da, dtype='d')[1] = 8
+        self.assertEqual(list(da), [1, 2, 3])
+        with self.assertRaises(ValueError):
+            np.array(da, dtype='d', copy=False)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Tests for the ordering guarantees of ConcurrentPriorityQueue and AsyncPriorityQueue.
+"""
+
+import asyncio
+import unittest
+
+from priority_queue import AsyncPriorityQueue, ConcurrentPriorityQueue
+
+BATCH = [(5, 'a'), (1, 'b'), (5, 'c'), (1, 'd'), (5, 'e'), (1, 'f'), (5, 'g')]
+
+
+def _first(pair):
+    return pair[0]
+
+
+def _queued(size: int) -> list:
+    """Items already waiting in the queue, all with keys above the batch's"""
+    return [(10 + index % 7, index) for index in range(size)]
+
+
+class StablePutManyTest(unittest.TestCase):
+    """put_many on a stable queue must keep equal keys in the order they were given"""
+
+    def check(self, drain):
+        # 1000 queued items make put_many meld the batch node by node, 0 and 5 heapify it in bulk
+        for size in (0, 5, 1000):
+            for key in (_first, lambda pair: pair[0]):
+                with self.subTest(queued=size, shared_key=key is _first):
+                    queued = _queued(size)
+                    expected = sorted(queued + BATCH, key=_first)
+                    self.assertEqual(drain(queued, key), expected)
+
+    def test_concurrent_queue(self):
+        def drain(queued, key):
+            queue = ConcurrentPriorityQueue(queued, key=key, stable=True)
+            queue.put_many(BATCH)
+            return list(queue.get_many(len(queued) + len(BATCH)))
+        self.check(drain)
+
+    def test_async_queue(self):
+        def drain(queued, key):
+            async def run():
+                queue = AsyncPriorityQueue(queued, key=key, stable=True)
+                queue.put_many(BATCH)
+                return [await queue.get() for _ in range(len(queued) + len(BATCH))]
+            return asyncio.run(run())
+        self.check(drain)
+
+    def test_put_many_after_put(self):
+        queue = ConcurrentPriorityQueue([(10, 'x')] * 100, key=_first, stable=True)
+        queue.put((5, 'first'))
+        queue.put_many([(5, 'second'), (5, 'third')])
+        queue.put((5, 'fourth'))
+        self.assertEqual([queue.get()[1] for _ in range(4)], ['first', 'second', 'third', 'fourth'])
+
+
+if __name__ == '__main__':
+    unittest.main()